@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Замер времени поиска элементов до и после оптимизации локаторов:
+исходный xpath против css-эквивалента в браузере и перекомпиляция xpath
+против кэша скомпилированных выражений при разборе html-исходника в lxml.
+
+Запуск из корня репозитория (нужен chromedriver в `PATH`):
+    python -m benchmarks.locators
+"""
+import time
+from io import StringIO
+from statistics import median
+from typing import Callable
+
+from lxml import etree
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from src.core import HTML_PARSER
+from src.helpers.composite_elements import TableLocators
+from src.helpers.locators import compiled_xpath, xpath_to_css
+from src.page_objects.sql_page import SQLLocators
+
+PAGE_URL = "https://www.w3schools.com/sql/trysql.asp?filename=trysql_select_all"
+QUERY = "select * from Customers"
+ROUNDS = 50
+TABLE_ROWS = f"{TableLocators.table}//tr"
+TABLE_CELLS = f"{TableLocators.table}//td"
+
+
+def measure(func: Callable, rounds: int = ROUNDS) -> float:
+    """Медианное время одного вызова в миллисекундах"""
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return median(timings) * 1000
+
+
+def main():
+    options = webdriver.ChromeOptions()
+    options.add_argument("headless=new")
+    options.add_argument("no-sandbox")
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.get(PAGE_URL)
+        driver.execute_script(f'window.editor.getDoc().setValue("{QUERY}")')
+        driver.find_element(By.XPATH, SQLLocators.run_button).click()
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.XPATH, TableLocators.table))
+        )
+
+        print(f"{'locator':<60} {'before, ms':>10} {'after, ms':>10}")
+        locators = [
+            SQLLocators.query_input,
+            SQLLocators.output_msg,
+            TableLocators.table,
+            TABLE_CELLS,
+        ]
+        for xpath in locators:
+            css = xpath_to_css(xpath)
+            if css.first_only:
+                before = measure(lambda: driver.find_element(By.XPATH, xpath))
+                after = measure(
+                    lambda: driver.find_element(By.CSS_SELECTOR, css.selector)
+                )
+            else:
+                before = measure(lambda: driver.find_elements(By.XPATH, xpath))
+                after = measure(
+                    lambda: driver.find_elements(By.CSS_SELECTOR, css.selector)
+                )
+            print(f"{xpath:<60} {before:>10.2f} {after:>10.2f}")
+
+        html = etree.parse(StringIO(driver.page_source), HTML_PARSER)
+        before = measure(lambda: html.xpath(TABLE_ROWS))
+        after = measure(lambda: compiled_xpath(TABLE_ROWS)(html))
+        print(f"{'lxml: ' + TABLE_ROWS:<60} {before:>10.2f} {after:>10.2f}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,19 @@
 from __future__ import annotations
 
 import contextlib
+import threading
 import time
 from inspect import stack
 from io import StringIO
-from typing import List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import allure
 from lxml import etree
-from lxml.etree import _ElementTree
+from lxml.etree import _Element, _ElementTree
 from selenium.common.exceptions import (
     InvalidArgumentException,
+    JavascriptException,
+    StaleElementReferenceException,
     TimeoutException,
 )
 from selenium.webdriver import ActionChains, Keys
@@ -22,11 +25,76 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from src.checks.web import is_page_url_change
-from src.helpers.singletons import SingletonDriver
+from src.helpers.latency import LATENCY_MODEL
+from src.helpers.locators import warn_unanchored_scan, xpath_to_css
+from src.helpers.retry import ElementNotFound, retry_step
+from src.helpers.singletons import CurrentTab, DomGeneration, SingletonDriver
 
 DEFAULT_TIMEOUT = 5
 DEFAULT_ATTEMPTS_COUNT = 10
+# Пауза между проверками загрузки страницы, драйвер может задать свою `page_load_poll`
+PAGE_LOAD_POLL = 0.5
 HTML_PARSER = etree.HTMLParser()
+_thread_parsers = threading.local()
+SUBTREE_HTML_SCRIPT = "return arguments[0].outerHTML;"
+# Разобранные снимки поддеревьев текущего поколения DOM:
+# {(вкладка, локатор, id элемента): корень поддерева}
+SNAPSHOT_CACHE: Dict[Tuple[Optional[str], str, str], _Element] = {}
+_snapshot_generation: Optional[int] = None
+_snapshot_lock = threading.Lock()
+# Поиск всех элементов по локатору и чтение их значений за один вызов драйвера.
+# Для неподдерживаемого типа локатора возвращает undefined (None в python)
+BULK_READ_SCRIPT = """
+const [using, value, root, mode, name] = arguments;
+const context = root || document;
+let nodes = [];
+if (using === "css selector") {
+    nodes = Array.from(context.querySelectorAll(value));
+} else if (using === "xpath") {
+    const found = document.evaluate(
+        value, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    for (let i = 0; i < found.snapshotLength; i++) {
+        nodes.push(found.snapshotItem(i));
+    }
+} else {
+    return undefined;
+}
+switch (mode) {
+    case "count":
+        return nodes.length;
+    case "item":
+        return nodes.length ? [nodes.at(name) || null] : false;
+    case "text":
+        // Как WebElement.text: у неотображаемых элементов пустая строка,
+        // неразрывные пробелы заменены обычными, пробелы по краям обрезаны
+        return nodes.map(node => {
+            const shown = node.getClientRects().length > 0
+                && getComputedStyle(node).visibility !== "hidden";
+            return shown ? node.innerText.replace(/\\u00a0/g, " ").trim() : "";
+        });
+    case "attribute":
+        return nodes.map(node => node.getAttribute(name));
+    case "properties":
+        return nodes.map(node => Object.fromEntries(name.map(key => [key, node[key]])));
+}
+"""
+
+
+def html_parser() -> etree.HTMLParser:
+    """
+    Html-парсер текущего потока: экземпляр парсера lxml нельзя использовать
+    одновременно из нескольких потоков, например при мультиплексировании вкладок
+    """
+    if threading.current_thread() is threading.main_thread():
+        return HTML_PARSER
+    if not hasattr(_thread_parsers, "parser"):
+        _thread_parsers.parser = etree.HTMLParser()
+    return _thread_parsers.parser
+
+
+class BulkReadUnsupported(Exception):
+    """Локатор не поддерживается пакетным чтением через js"""
 
 
 class BasePage:
@@ -87,6 +155,7 @@ class BasePage:
 
         if url and url != cur_url:
             self.driver.get(url)
+            DomGeneration.bump()
             self.wait_page_loaded(
                 sleep_before_execute=sleep_before_execute,
                 attempts_to_load=attempts_to_load,
@@ -195,11 +264,20 @@ class BasePage:
 
             if isinstance(item, BaseElement):
                 locator = getattr(item, "_locator")[1]
-                driver = self.driver
+                key = f"{item.scoped_locator} disappearance"
+                timeout = LATENCY_MODEL.timeout(key, DEFAULT_TIMEOUT)
+                started = time.monotonic()
                 with contextlib.suppress(Exception):
-                    disappear = WebDriverWait(driver, DEFAULT_TIMEOUT).until_not(
+                    disappear = WebDriverWait(
+                        driver=self.driver,
+                        timeout=timeout,
+                        poll_frequency=LATENCY_MODEL.poll_frequency(key),
+                    ).until_not(
                         EC.presence_of_element_located((By.XPATH, locator))
                     )
+                LATENCY_MODEL.record(
+                    key, time.monotonic() - started if disappear else timeout
+                )
             elif isinstance(item, str) and isinstance(self, BaseElement):
                 if hasattr(self._page, item):
                     item = getattr(self._page, item)
@@ -226,8 +304,9 @@ class BasePage:
 
         page_load_checklist = {check: False for check in checks_to_do}
         attempt_counter = 0
+        poll = getattr(self.driver, "page_load_poll", PAGE_LOAD_POLL)
         while not all(page_load_checklist.values()):
-            time.sleep(0.5)
+            time.sleep(poll)
 
             for check, with_value in checks_to_do.items():
                 result = make_this[check](with_value)
@@ -240,6 +319,62 @@ class BasePage:
         if sleep_after_execute and isinstance(sleep_after_execute, (int, float)):
             time.sleep(sleep_after_execute)
 
+    @allure.step("Дождаться первого выполнившегося условия")
+    def wait_first(
+            self,
+            conditions: Dict[str, Callable[[WebDriver], Any]],
+            timeout: Union[int, float] = 0,
+            key: str = "",
+            default_timeout: Union[int, float] = DEFAULT_TIMEOUT,
+    ) -> Tuple[Optional[str], Any]:
+        """
+        Гонка нескольких условий ожидания: возвращается первое выполнившееся,
+        не дожидаясь истечения таймаутов остальных
+        :param conditions: словарь вида {имя условия: условие ожидания}
+        :param timeout: максимальное время ожидания, по умолчанию из модели задержек
+        :param key: имя ожидания в модели задержек, по умолчанию из имён условий
+        :param default_timeout: таймаут, пока у модели задержек мало истории,
+        и одновременно верхняя граница выведенного ею таймаута
+        :return: имя и результат выполнившегося условия либо (None, None)
+        """
+        key = key or " | ".join(conditions)
+        timeout = timeout or LATENCY_MODEL.timeout(key, default_timeout)
+
+        def first_satisfied(driver: WebDriver):
+            for name, condition in conditions.items():
+                with contextlib.suppress(Exception):
+                    if result := condition(driver):
+                        return name, result
+            return False
+
+        started = time.monotonic()
+        try:
+            name, result = WebDriverWait(
+                driver=self.driver,
+                timeout=timeout,
+                poll_frequency=LATENCY_MODEL.poll_frequency(key),
+            ).until(first_satisfied)
+        except TimeoutException:
+            LATENCY_MODEL.record(key, timeout)
+            return None, None
+        LATENCY_MODEL.record(key, time.monotonic() - started)
+        allure.attach(name=f"Выполнилось условие: {name}", body=str(name))
+        return name, result
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """Контрольная точка страницы, восстанавливаемая перед повтором шага"""
+        return {"url": self.driver.current_url}
+
+    @allure.step("Восстановить контрольную точку страницы")
+    def restore(self, checkpoint: Dict[str, Any]) -> None:
+        """
+        :param checkpoint: контрольная точка, снятая методом `checkpoint`
+        """
+        if self.driver.current_url != checkpoint["url"]:
+            self.driver.get(checkpoint["url"])
+        DomGeneration.bump()
+        self.wait_page_loaded()
+
     @allure.step("Создать базовый элемент с локатором {xpath}")
     def make_base_element(self, xpath: str) -> BaseElement:
         """
@@ -249,15 +384,81 @@ class BasePage:
         return BaseElement(locator=xpath, page=self)
 
     @allure.step("Получить дерево элементов из html-исходника страницы")
-    def get_etree(self) -> _ElementTree:
-        return etree.parse(StringIO(self.driver.page_source), HTML_PARSER)
+    def get_etree(
+            self,
+            subtree: Union[str, BaseElement, None] = None,
+    ) -> Union[_ElementTree, _Element, None]:
+        """
+        Снимок html-исходника страницы либо только поддерева элемента (`outerHTML`).
+        Снимок поддерева кэшируется по id веб-элемента до следующего действия,
+        меняющего DOM, поэтому повторные чтения одного состояния не передают
+        и не разбирают html заново. Перед попаданием в кэш элемент проверяется
+        на устаревание: заменённый ajax-перерисовкой элемент читается заново.
+        Исходник всей страницы всегда читается заново: асинхронные изменения
+        страницы (ответ ajax) не меняют поколение DOM, и кэш отдал бы устаревший снимок
+        :param subtree: базовый элемент или xpath-локатор корня поддерева
+        :return: дерево всей страницы, корневой элемент поддерева либо None,
+        если элемент не найден
+        """
+        global _snapshot_generation
+
+        if isinstance(subtree, str):
+            subtree = BaseElement(locator=subtree, page=self)
+        with _snapshot_lock:
+            if _snapshot_generation != (generation := DomGeneration.current()):
+                SNAPSHOT_CACHE.clear()
+                _snapshot_generation = generation
+
+        key = None
+        if subtree is None:
+            source = self.driver.page_source
+        else:
+            for attempt in range(2):
+                if (handle := subtree.handle()) is None:
+                    return None
+                key = (CurrentTab.get(), subtree.scoped_locator, handle.id)
+                with _snapshot_lock:
+                    snapshot = SNAPSHOT_CACHE.get(key)
+                try:
+                    if snapshot is not None:
+                        # Ответ ajax не меняет поколение DOM, поэтому снимок отдаётся,
+                        # только пока его элемент не заменён на странице
+                        _ = handle.tag_name
+                        return snapshot
+                    source = self.driver.execute_script(SUBTREE_HTML_SCRIPT, handle)
+                    break
+                except StaleElementReferenceException:
+                    if attempt:
+                        raise
+                    subtree.invalidate_handle()
+
+        started = time.perf_counter()
+        if subtree is None:
+            snapshot = etree.parse(StringIO(source), html_parser())
+        else:
+            # Парсер html оборачивает фрагмент в html/body, корень поддерева - внутри
+            snapshot = etree.fromstring(source, html_parser()).find("body")[0]
+        parse_time = (time.perf_counter() - started) * 1000
+        if key is not None:
+            with _snapshot_lock:
+                SNAPSHOT_CACHE[key] = snapshot
+        allure.attach(
+            name=f"Снимок {key[1] if key else 'page'}: {len(source)} символов, "
+                 f"разбор {parse_time:.1f} мс",
+            body=f"{len(source)=}\n{parse_time=:.1f} ms",
+        )
+        return snapshot
 
 
 class BaseElement:
     """Базовый элемент используемый в Page Object"""
 
     _locator: Tuple[str, str] = ("", "")
+    _lookup_locator: Tuple[str, str] = ("", "")
+    _lookup_all_locator: Tuple[str, str] = ("", "")
     _page: BasePage = None
+    _parent: Optional[BaseElement] = None
+    _handles: Dict[Optional[str], Tuple[int, WebElement]]
     _timeout: Union[float, int] = 0.1
     _elem_name: str = ""
     _action: ActionChains
@@ -266,9 +467,18 @@ class BaseElement:
             self,
             locator: Union[tuple, str],
             page=None,
+            parent: Optional[BaseElement] = None,
     ):
+        """
+        :param locator: xpath-локатор, для дочернего элемента - относительный
+        (`.//td`) от веб-элемента родителя
+        :param page: страница, которой принадлежит элемент
+        :param parent: базовый элемент, внутри поддерева которого ищется элемент
+        """
         self._driver = SingletonDriver()
         self._page = page or BasePage()
+        self._parent = parent
+        self._handles = {}
 
         if isinstance(locator, tuple):
             locator_type, locator_path = locator
@@ -280,6 +490,12 @@ class BaseElement:
                 f"\nLocator value: {locator=}"
             )
         self._locator = By.XPATH, locator_path
+        self._lookup_locator = self._lookup_all_locator = self._locator
+        if css := xpath_to_css(locator_path):
+            self._lookup_locator = By.CSS_SELECTOR, css.selector
+            if not css.first_only:
+                self._lookup_all_locator = self._lookup_locator
+        warn_unanchored_scan(locator_path)
         stack_ = stack()
         try:
             frame = next(filter(lambda x: "locator" in x.code_context[0], stack_))
@@ -293,7 +509,13 @@ class BaseElement:
         return "%s :%s" % self.locator_with_type
 
     def __getitem__(self, item: int) -> WebElement:
-        return self.find_all(DEFAULT_TIMEOUT)[item]
+        found = self._bulk_read(
+            "item", item, DEFAULT_TIMEOUT,
+            fallback=lambda: [self.find_all(DEFAULT_TIMEOUT)[item]],
+        )
+        if not found or found[0] is None:
+            raise IndexError(f"{self} has no element with index {item}")
+        return found[0]
 
     @property
     def locator(self):
@@ -303,10 +525,31 @@ class BaseElement:
     def locator_with_type(self):
         return self._locator
 
+    @property
+    def lookup_locator(self):
+        """Локатор для поиска одного элемента: css-эквивалент xpath, если он есть"""
+        return self._lookup_locator
+
+    @property
+    def lookup_all_locator(self):
+        """Локатор для поиска всех элементов: css-эквивалент xpath, если он есть"""
+        return self._lookup_all_locator
+
+    @property
+    def scoped_locator(self):
+        """Локатор с учётом цепочки родителей, используется как ключ в истории"""
+        if self._parent is None:
+            return self.locator
+        return f"{self._parent.scoped_locator} >> {self.locator}"
+
     @property
     def page(self):
         return self._page
 
+    @property
+    def parent(self):
+        return self._parent
+
     @property
     def driver(self):
         return SingletonDriver()
@@ -319,6 +562,77 @@ class BaseElement:
     def action(self):
         return ActionChains(SingletonDriver())
 
+    def _wait_for(
+            self,
+            condition: Callable[[WebDriver], Any],
+            timeout: Union[int, float] = 0,
+            ignored_exceptions: Optional[list] = None,
+    ) -> Any:
+        """
+        Ожидание условия с таймаутом и частотой опроса из модели задержек.
+        Время выполнения условия (либо таймаут) записывается в историю локатора
+        :param condition: условие ожидания
+        :param timeout: максимальное время ожидания, по умолчанию из модели задержек
+        :param ignored_exceptions: исключения, игнорируемые во время ожидания
+        :raises: TimeoutException если условие не выполнилось
+        """
+        key = self.scoped_locator
+        timeout = timeout or LATENCY_MODEL.timeout(key, self._timeout)
+        started = time.monotonic()
+        for attempt in range(2):
+            if (context := self._search_context(timeout)) is None:
+                raise TimeoutException(f"Parent of {self} is not found")
+            try:
+                result = WebDriverWait(
+                    driver=context,
+                    timeout=timeout,
+                    poll_frequency=LATENCY_MODEL.poll_frequency(key),
+                    ignored_exceptions=ignored_exceptions,
+                ).until(condition)
+                break
+            except TimeoutException:
+                LATENCY_MODEL.record(key, timeout)
+                raise
+            except StaleElementReferenceException:
+                # Родитель перерисован без изменения поколения DOM - ищем его заново
+                if self._parent is None or attempt:
+                    raise
+                self._parent.invalidate_handle()
+        LATENCY_MODEL.record(key, time.monotonic() - started)
+        return result
+
+    def _search_context(
+            self,
+            timeout: Union[int, float] = 0,
+    ) -> Optional[Union[WebDriver, WebElement]]:
+        """
+        Контекст поиска элемента: веб-драйвер либо закэшированный веб-элемент
+        родителя, чтобы поиск не выходил за пределы его поддерева
+        :param timeout: максимальное время ожидания на поиск родителя
+        """
+        if self._parent is None:
+            return self.driver
+        return self._parent.handle(timeout)
+
+    def handle(self, timeout: Union[int, float] = 0) -> Optional[WebElement]:
+        """
+        Веб-элемент, закэшированный в пределах текущего поколения DOM:
+        родитель ищется один раз на каждую отрисовку страницы.
+        При мультиплексировании по вкладкам у каждой вкладки свой кэш
+        :param timeout: максимальное время ожидания на поиск элемента
+        """
+        generation, tab = DomGeneration.current(), CurrentTab.get()
+        cached_generation, element = self._handles.get(tab, (None, None))
+        if element is None or cached_generation != generation:
+            if element := self.find(timeout):
+                self._handles[tab] = generation, element
+            else:
+                self._handles.pop(tab, None)
+        return element
+
+    def invalidate_handle(self) -> None:
+        self._handles.pop(CurrentTab.get(), None)
+
     @allure.step("Найти элемент")
     def find(self, timeout: Union[int, float] = 0) -> Optional[WebElement]:
         """
@@ -327,10 +641,9 @@ class BaseElement:
         """
         element = None
         allure.attach(name=self.locator, body=self.locator)
-        timeout = timeout or self._timeout
         with contextlib.suppress(Exception):
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(self._locator)
+            element = self._wait_for(
+                EC.presence_of_element_located(self.lookup_locator), timeout
             )
         return element
 
@@ -344,11 +657,11 @@ class BaseElement:
         """
         element = None
         try:
-            element = WebDriverWait(
-                driver=self.driver,
-                timeout=timeout or self._timeout,
+            element = self._wait_for(
+                EC.element_to_be_clickable(self.lookup_locator),
+                timeout,
                 ignored_exceptions=[InvalidArgumentException],
-            ).until(EC.element_to_be_clickable(self.locator_with_type))
+            )
 
         except TimeoutException as timeout_exception:
             raise timeout_exception
@@ -365,6 +678,7 @@ class BaseElement:
         if key not in Keys.__dict__.values() and len(key) > 1:
             raise UserWarning(f"Unexpected value of {key=}")
         self.action.key_down(key).key_up(key).perform()
+        DomGeneration.bump()
 
     def _build_keys_input(self, keys: str) -> ActionChains:
         """
@@ -376,6 +690,7 @@ class BaseElement:
             result.key_down(k).key_up(k)
         return result
 
+    @retry_step()
     @allure.step("Заполнить элемент {0} значением {keys}")
     def send_keys(
             self,
@@ -392,7 +707,7 @@ class BaseElement:
         """
         keys = keys if isinstance(keys, str) else str(keys)
         keys = keys.replace("\n", "\ue007")
-        if element := self.find(timeout=timeout_to_find or self._timeout):
+        if element := self.find(timeout=timeout_to_find):
             element.click()
             (
                 self.action
@@ -403,6 +718,7 @@ class BaseElement:
             )
             self.press_key(Keys.DELETE)
             self._build_keys_input(keys).perform()
+            DomGeneration.bump()
             wait_kwargs_dict = {
                 "attempts_to_load": kw.get("attempts_to_load", 0),
                 "wait_until_find": kw.get("wait_until_find"),
@@ -415,7 +731,7 @@ class BaseElement:
             self._page.wait_page_loaded(**wait_kwargs_dict)
         else:
             msg = "BaseElement with locator {0} not found"
-            raise AttributeError(msg.format(self.locator))
+            raise ElementNotFound(msg.format(self.locator))
 
         return True
 
@@ -425,9 +741,10 @@ class BaseElement:
         :param timeout: максимальное время ожидания на поиск элемента
         """
         return element.text if (
-            element := self.find(timeout=timeout or self._timeout)
+            element := self.find(timeout=timeout)
         ) else ""
 
+    @retry_step()
     @allure.step("Кликнуть по элементу {0}")
     def click(self, timeout_to_find: Union[int, float] = 0, **kw):
         """
@@ -436,16 +753,15 @@ class BaseElement:
         """
         if not (
                 element := (
-                        self._wait_to_be_clickable(
-                            timeout=timeout_to_find or self._timeout
-                        )
+                        self._wait_to_be_clickable(timeout=timeout_to_find)
                 )
         ):
-            raise AttributeError(f"BaseElement with locator {self._locator} not found")
+            raise ElementNotFound(f"BaseElement with locator {self._locator} not found")
 
         action = ActionChains(self.driver)
 
         action.move_to_element(element).click(on_element=element).perform()
+        DomGeneration.bump()
 
         wait_kwargs_dict = {
             "attempts_to_load": kw.get("attempts_to_load", 0),
@@ -464,24 +780,56 @@ class BaseElement:
         :param timeout: максимальное время ожидания на поиск элемента
         :return: список веб-элементов
         """
+        elements = []
         allure.attach(name=self.locator, body=self.locator)
         with contextlib.suppress(Exception):
-            elements = WebDriverWait(
-                driver=self.driver,
-                timeout=timeout or self._timeout
-            ).until(
-                EC.presence_of_all_elements_located(self.locator_with_type)
+            elements = self._wait_for(
+                EC.presence_of_all_elements_located(self.lookup_all_locator), timeout
             )
         return elements or []
 
+    def _bulk_read(
+            self,
+            mode: str,
+            name: Any = None,
+            timeout: Union[int, float] = 0,
+            fallback: Callable[[], Any] = None,
+    ) -> Any:
+        """
+        Пакетное чтение всех найденных элементов одним вызовом `execute_script`.
+        Для локаторов, которые не исполнить в js, используется поэлементный `fallback`
+        :param mode: что прочитать: count, item, text, attribute, properties
+        :param name: индекс, имя атрибута или список имён свойств
+        :param timeout: максимальное время ожидания на поиск элементов
+        :param fallback: поэлементная реализация того же чтения
+        :return: результат чтения, либо None если элементы не найдены
+        """
+        def read(context: Union[WebDriver, WebElement]):
+            root = context if isinstance(context, WebElement) else None
+            result = self.driver.execute_script(
+                BULK_READ_SCRIPT, *self.lookup_all_locator, root, mode, name
+            )
+            if result is None:
+                raise BulkReadUnsupported(self.lookup_all_locator)
+            return result
+
+        allure.attach(name=self.locator, body=self.locator)
+        try:
+            return self._wait_for(read, timeout)
+        except TimeoutException:
+            return None
+        except (BulkReadUnsupported, JavascriptException):
+            return fallback()
+
     @allure.step("Подсчитать количество элементов по локатору: {0}")
     def count(self, timeout: Union[int, float] = 0) -> int:
         """
         :param timeout: максимальное время ожидания на поиск элемента
         :return: число найденных веб-элементов
         """
-        elements = self.find_all(timeout or self._timeout)
-        result = len(elements)
+        result = self._bulk_read(
+            "count", timeout=timeout, fallback=lambda: len(self.find_all(timeout))
+        ) or 0
         allure.attach(name=f"Найдено элементов: {result}", body=str(result))
         return result
 
@@ -491,10 +839,50 @@ class BaseElement:
         :param timeout: максимальное время ожидания на поиск элемента
         :return: список строк из атрибута `text` содержащегося в найденных веб-элементах
         """
-        result = []
-        if elements := self.find_all(timeout=timeout or self._timeout):
-            for element in elements:
+        def read_one_by_one():
+            result = []
+            for element in self.find_all(timeout=timeout):
+                text = ""
                 with contextlib.suppress(Exception):
                     text = element.text
-                result.append("" or text)
-        return result
+                result.append(text)
+            return result
+
+        return self._bulk_read("text", timeout=timeout, fallback=read_one_by_one) or []
+
+    @allure.step("Получить атрибут {name} всех элементов найденных по локатору: {0}")
+    def get_attribute_of_all(
+            self,
+            name: str,
+            timeout: Union[int, float] = 0,
+    ) -> List[Optional[str], ...]:
+        """
+        :param name: имя html-атрибута
+        :param timeout: максимальное время ожидания на поиск элемента
+        :return: список значений атрибута найденных веб-элементов
+        """
+        return self._bulk_read(
+            "attribute", name, timeout,
+            fallback=lambda: [
+                element.get_attribute(name) for element in self.find_all(timeout)
+            ],
+        ) or []
+
+    @allure.step("Получить свойства {names} всех элементов найденных по локатору: {0}")
+    def get_properties_of_all(
+            self,
+            names: List[str, ...],
+            timeout: Union[int, float] = 0,
+    ) -> List[Dict[str, Any], ...]:
+        """
+        :param names: имена js-свойств элемента
+        :param timeout: максимальное время ожидания на поиск элемента
+        :return: список словарей вида {имя свойства: значение} найденных веб-элементов
+        """
+        return self._bulk_read(
+            "properties", list(names), timeout,
+            fallback=lambda: [
+                {key: element.get_property(key) for key in names}
+                for element in self.find_all(timeout)
+            ],
+        ) or []
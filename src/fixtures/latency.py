@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+import pytest
+from _pytest.config import Config
+
+from src.helpers.latency import LATENCY_CACHE_KEY, LATENCY_MODEL
+
+
+@pytest.fixture(scope="session", autouse=True)
+def latency_model(pytestconfig: Config):
+    """
+    Фикстура модели задержек: подгружает историю времени появления элементов из
+    кэша pytest и дописывает в него замеры текущей сессии по её завершении.
+    При воспроизведении записи (`--webdriver-replay`) ответы приходят мгновенно,
+    поэтому замеры не пишутся, иначе они занизили бы таймауты реальных прогонов
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    LATENCY_MODEL.recording = not pytestconfig.getoption("--webdriver-replay")
+    if cache is not None:
+        LATENCY_MODEL.load(cache.get(LATENCY_CACHE_KEY, {}))
+    yield LATENCY_MODEL
+    if cache is not None and LATENCY_MODEL.recording:
+        cache.set(
+            LATENCY_CACHE_KEY,
+            LATENCY_MODEL.merge_into(cache.get(LATENCY_CACHE_KEY, {})),
+        )
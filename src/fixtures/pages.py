@@ -1,10 +1,33 @@
 # -*- coding: utf-8 -*-
 import pytest
+from _pytest.fixtures import FixtureRequest
+from selenium.webdriver.remote.webdriver import WebDriver
 
+from src.helpers.tabs import TabScheduler
 from src.page_objects.sql_page import SQLPage
 
 
 @pytest.fixture
-def sql_page():
-    """Фикстура страницы с SQL-редактором"""
+def sql_page(selenium: WebDriver):
+    """
+    Фикстура страницы с SQL-редактором
+    :param selenium: инициализированный веб-драйвер
+    """
     return SQLPage()
+
+
+@pytest.fixture
+def tab_scheduler(selenium: WebDriver, request: FixtureRequest):
+    """
+    Фикстура планировщика независимых сценариев по вкладкам одного браузера,
+    сценарии получают страницу с SQL-редактором (ограничения см. в `TabScheduler`)
+    :param selenium: инициализированный веб-драйвер
+    :param request: фикстура контекста подзапроса тестовой сессии
+    """
+    scheduler = TabScheduler(
+        driver=selenium,
+        tabs=request.config.getoption("--tabs"),
+        page_factory=SQLPage,
+    )
+    yield scheduler
+    scheduler.close()
@@ -1,15 +1,60 @@
 # -*- coding: utf-8 -*-
+import os
+import random
+from functools import partial
 from math import ceil
 
+import allure
 import pytest
 from _pytest.config import Config
 from _pytest.fixtures import FixtureRequest
+from _pytest.nodes import Item
 from pytest_selenium import drivers, split_class_and_test_names
 from selenium.webdriver import DesiredCapabilities
 from selenium.webdriver.chromium.options import ChromiumOptions
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from src.core import SingletonDriver
+from src.helpers.artifacts import ARTIFACTS_DIR_NAME, ArtifactWriter
+from src.helpers.browser import LAUNCH_PROFILES, BrowserResourceSampler
+from src.helpers.memo import MemoizingExecutor
+from src.helpers.replay import RecordingExecutor, ReplayDriver, recording_path
+from src.helpers.retry import RETRY_STATS
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: Item):
+    """Сохранение отчётов фаз теста в его узле для использования в фикстурах"""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: Item):
+    """
+    Начало отсчёта времени теста для статистики повторов шагов: перезапуск
+    теста повторил бы и setup фикстур, включая запуск браузера
+    """
+    RETRY_STATS.reset()
+
+
+@pytest.fixture(scope="session")
+def artifact_writer(pytestconfig: Config):
+    """
+    Сессионный пул фоновой записи артефактов упавших тестов.
+    По завершении сессии дожидается записи всех артефактов
+    """
+    directory = os.path.join(
+        pytestconfig.getoption("--alluredir", None) or "allure_results",
+        ARTIFACTS_DIR_NAME,
+    )
+    writer = ArtifactWriter(
+        directory=directory,
+        worker=os.environ.get("PYTEST_XDIST_WORKER", "master"),
+    )
+    yield writer
+    writer.shutdown()
 
 
 @pytest.fixture
@@ -22,13 +67,48 @@ def selenium(selenium: WebDriver, request: FixtureRequest):
     :return: веб-драйвер
     """
     SingletonDriver(selenium)
+    recorder = None
+    if request.config.getoption("--webdriver-record") or request.config.getoption(
+            "--webdriver-replay"
+    ):
+        # Случайный выбор в тестах должен совпадать у записи и воспроизведения
+        random.seed(request.node.nodeid)
+    if record_dir := request.config.getoption("--webdriver-record"):
+        recorder = RecordingExecutor.install(selenium)
+        recorder.record_session(selenium)
+    memo = MemoizingExecutor.install(selenium)
     size = request.config.getoption("--size")
     selenium.set_window_size(*size)
     selenium.implicitly_wait(3)
     selenium.set_page_load_timeout(time_to_wait=30)
     if not getattr(selenium, "element_timeout", None):
         selenium.element_timeout = ceil(selenium.timeouts.page_load / 5)
-    return selenium
+    memo.reset_stats()
+    yield selenium
+    stats = memo.stats()
+    request.node.user_properties.extend(stats.items())
+    allure.attach(
+        name="Кэш команд веб-драйвера",
+        body="\n".join(f"{key}: {value}" for key, value in stats.items()),
+        attachment_type=allure.attachment_type.TEXT,
+    )
+    if recorder:
+        recorder.save(recording_path(record_dir, request.node.nodeid))
+
+
+@pytest.fixture
+def driver_class(request: FixtureRequest, driver_class):
+    """
+    Подмена класса веб-драйвера на воспроизводящий запись прогона без браузера,
+    если передана опция `--webdriver-replay`
+    :param request: фикстура контекста подзапроса тестовой сессии
+    :param driver_class: класс веб-драйвера из pytest-selenium
+    """
+    if replay_dir := request.config.getoption("--webdriver-replay"):
+        return partial(
+            ReplayDriver, recording=recording_path(replay_dir, request.node.nodeid)
+        )
+    return driver_class
 
 
 @pytest.fixture
@@ -61,23 +141,99 @@ def chrome_options(request: FixtureRequest, chrome_options: ChromiumOptions):
     chrome_options.add_argument("disable-dev-shm-usage")
     chrome_options.add_argument("disable-infobars")
     chrome_options.add_argument("disable-extensions")
+    profile = request.config.getini("browser_profile")
+    if profile not in LAUNCH_PROFILES:
+        raise UserWarning(
+            f"Unexpected {profile=}. Expect one of {', '.join(LAUNCH_PROFILES)}"
+        )
+    for argument in LAUNCH_PROFILES[profile]:
+        chrome_options.add_argument(argument)
+    if request.config.getoption("--tabs") > 1:
+        # Вкладки в фоне не должны тормозиться, пока драйвер работает с другой
+        chrome_options.add_argument("disable-background-timer-throttling")
+        chrome_options.add_argument("disable-backgrounding-occluded-windows")
+        chrome_options.add_argument("disable-renderer-backgrounding")
     return chrome_options
 
 
 @pytest.fixture(autouse=True)
-def driver_closure(selenium: WebDriver, request: FixtureRequest):
+def driver_closure(request: FixtureRequest, artifact_writer: ArtifactWriter):
     """
-    Teardown фикстура закрытия сессии внутри синглтона веб-драйвера
-    :param selenium: инициализированный библиотекой pytest-selenium веб-драйвер
+    Teardown фикстура закрытия сессии внутри синглтона веб-драйвера.
+    Для упавшего теста снимает артефакты и отдаёт их на фоновую запись,
+    в отчёт allure прикладывается только индекс файлов: скриншот пишется
+    на диск пулом записи, а не синхронно в teardown.
+    Тестам, которым не нужен браузер, веб-драйвер не создаётся
     :param request: фикстура контекста подзапроса тестовой сессии
+    :param artifact_writer: пул фоновой записи артефактов
     """
     def close():
         SingletonDriver.clear_instance()
 
+    if "selenium" not in request.fixturenames:
+        yield None
+        return
+    selenium = request.getfixturevalue("selenium")
     yield selenium
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.failed:
+        raw = artifact_writer.collect(selenium)
+        paths = artifact_writer.submit(request.node.nodeid, raw)
+        allure.attach(
+            name="Артефакты падения",
+            body="\n".join(f"{name}: {path}" for name, path in paths.items()),
+            attachment_type=allure.attachment_type.TEXT,
+        )
     request.addfinalizer(close)
 
 
+@pytest.fixture(autouse=True)
+def browser_telemetry(request: FixtureRequest):
+    """
+    Замер памяти и cpu дерева процессов браузера за время теста.
+    Сводка попадает в свойства теста (junit/html-отчёт) и во вложения allure
+    :param request: фикстура контекста подзапроса тестовой сессии
+    """
+    if "selenium" not in request.fixturenames:
+        yield None
+        return
+    selenium = request.getfixturevalue("selenium")
+    process = getattr(getattr(selenium, "service", None), "process", None)
+    if process is None:
+        # Удалённый драйвер: процессы браузера на другой машине
+        yield None
+        return
+    sampler = BrowserResourceSampler(process.pid).start()
+    yield sampler
+    summary = sampler.stop()
+    summary["browser_profile"] = request.config.getini("browser_profile")
+    request.node.user_properties.extend(summary.items())
+    allure.attach(
+        name="Ресурсы браузера",
+        body="\n".join(f"{key}: {value}" for key, value in summary.items()),
+        attachment_type=allure.attachment_type.TEXT,
+    )
+
+
+@pytest.fixture(autouse=True)
+def step_retry_report(request: FixtureRequest):
+    """
+    Отчёт о повторах шагов за время теста и сэкономленном ими времени
+    по сравнению с перезапуском всего теста. Статистика сбрасывается
+    в `pytest_runtest_setup`, до запуска браузера другими фикстурами
+    :param request: фикстура контекста подзапроса тестовой сессии
+    """
+    yield RETRY_STATS
+    summary = RETRY_STATS.summary()
+    if summary["step_retries"]:
+        request.node.user_properties.extend(summary.items())
+        allure.attach(
+            name="Повторы шагов",
+            body="\n".join(f"{key}: {value}" for key, value in summary.items()),
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+
 @pytest.fixture
 def driver_kwargs(
         request: FixtureRequest,
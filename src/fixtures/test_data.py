@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import os
+from typing import Dict
+
+import pytest
+from _pytest.config import Config
+
+from src.helpers.test_data import CUSTOMER_COLUMNS, DataPool
+
+
+@pytest.fixture(scope="session")
+def customers_pool(pytestconfig: Config) -> DataPool:
+    """
+    Сессионный пул строк для таблицы Customers, сгенерированный с фиксированным
+    сидом и закэшированный в кэше pytest между прогонами.
+    Без кэша pytest (`-p no:cacheprovider`) пул генерируется в памяти
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    cache = getattr(pytestconfig, "cache", None)
+    return DataPool(
+        columns=CUSTOMER_COLUMNS,
+        size=int(pytestconfig.getini("test_data_pool_size")),
+        seed=int(pytestconfig.getini("test_data_seed")),
+        cache_dir=str(cache.mkdir("test_data")) if cache else None,
+        worker_index=int(worker.lstrip("gw") or 0),
+        workers_count=int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1)),
+    ).load()
+
+
+@pytest.fixture
+def customer_row(customers_pool: DataPool) -> Dict[str, str]:
+    """Уникальная строка для таблицы Customers вида {колонка: значение}"""
+    return customers_pool.row()
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Плагин подбора количества xdist-воркеров при `-n auto`: по доступным ядрам,
+свободной памяти и замеренному в прошлых прогонах потреблению одного браузера
+"""
+from __future__ import annotations
+
+import contextlib
+import os
+import time
+from math import floor
+from typing import Dict, List, Optional
+
+import psutil
+from _pytest.cacheprovider import Cache
+from _pytest.config import Config
+from _pytest.reports import TestReport
+from _pytest.stash import StashKey
+from _pytest.terminal import TerminalReporter
+
+from src.helpers.browser import BYTES_IN_MB
+from src.helpers.latency import percentile
+
+FOOTPRINT_CACHE_KEY = "workers/browser_footprint"
+FOOTPRINT_HISTORY_SIZE = 50
+DEFAULT_BROWSER_FOOTPRINT_MB = 500
+WORKER_OVERHEAD_MB = 100
+MEMORY_BUDGET_SHARE = 0.8
+MIN_BROWSER_CPU_PERCENT = 25
+MAX_WORKERS_PER_CPU = 2
+CGROUP_ROOT = "/sys/fs/cgroup"
+# Файлы лимита и текущего потребления памяти: cgroup v2, затем v1
+CGROUP_MEMORY_FILES = (
+    ("memory.max", "memory.current"),
+    (
+        os.path.join("memory", "memory.limit_in_bytes"),
+        os.path.join("memory", "memory.usage_in_bytes"),
+    ),
+)
+
+sizing_key = StashKey[Dict[str, float]]()
+
+
+def _cgroup_cpu_quota(cgroup_root: str) -> Optional[float]:
+    """
+    Квота cpu контейнера в ядрах: cgroup v2 (`cpu.max`) либо v1 (`cpu.cfs_quota_us`)
+    :param cgroup_root: точка монтирования cgroup
+    :return: квота или None, если она не задана
+    """
+    with contextlib.suppress(Exception), \
+            open(os.path.join(cgroup_root, "cpu.max")) as file:
+        quota, period = file.read().split()
+        return None if quota == "max" else int(quota) / int(period)
+    with contextlib.suppress(Exception), \
+            open(os.path.join(cgroup_root, "cpu", "cpu.cfs_quota_us")) as quota_file, \
+            open(os.path.join(cgroup_root, "cpu", "cpu.cfs_period_us")) as period_file:
+        quota = int(quota_file.read())
+        return None if quota < 0 else quota / int(period_file.read())
+    return None
+
+
+def _cgroup_memory_headroom(cgroup_root: str) -> Optional[int]:
+    """
+    Остаток памяти до лимита контейнера: cgroup v2 (`memory.max`) либо v1
+    (`memory.limit_in_bytes`). Снятый лимит v1 - число порядка 2**63,
+    его отсекает сравнение со свободной памятью хоста
+    :param cgroup_root: точка монтирования cgroup
+    :return: остаток в байтах или None, если лимит не задан
+    """
+    for limit_name, usage_name in CGROUP_MEMORY_FILES:
+        with contextlib.suppress(Exception), \
+                open(os.path.join(cgroup_root, limit_name)) as limit_file, \
+                open(os.path.join(cgroup_root, usage_name)) as usage_file:
+            limit = limit_file.read().strip()
+            return None if limit == "max" else int(limit) - int(usage_file.read())
+    return None
+
+
+def available_cpus(cgroup_root: str = CGROUP_ROOT) -> float:
+    """
+    Количество ядер с учётом привязки процесса и квоты cgroup контейнера
+    :param cgroup_root: точка монтирования cgroup
+    """
+    cpus = float(
+        len(os.sched_getaffinity(0))
+        if hasattr(os, "sched_getaffinity")
+        else os.cpu_count() or 1
+    )
+    if (quota := _cgroup_cpu_quota(cgroup_root)) is not None:
+        cpus = min(cpus, quota)
+    return max(cpus, 1.0)
+
+
+def available_memory_mb(cgroup_root: str = CGROUP_ROOT) -> float:
+    """
+    Свободная память с учётом лимита cgroup контейнера
+    :param cgroup_root: точка монтирования cgroup
+    """
+    available = psutil.virtual_memory().available
+    if (headroom := _cgroup_memory_headroom(cgroup_root)) is not None:
+        available = min(available, headroom)
+    return available / BYTES_IN_MB
+
+
+def browser_footprint(history: Dict[str, List[float]]) -> Dict[str, float]:
+    """
+    Оценка потребления одного браузера по истории прошлых прогонов
+    :param history: словарь вида {"peak_rss_mb": [...], "cpu_percent": [...]}
+    :return: p90 пиковой памяти в МБ и медиана загрузки cpu в %
+    """
+    peaks = history.get("peak_rss_mb") or [DEFAULT_BROWSER_FOOTPRINT_MB]
+    cpu = history.get("cpu_percent") or [100]
+    return {
+        "peak_rss_mb": percentile(peaks, 0.9),
+        "cpu_percent": percentile(cpu, 0.5),
+    }
+
+
+def choose_workers_count(
+        cpus: float,
+        memory_mb: float,
+        footprint: Dict[str, float],
+) -> Dict[str, float]:
+    """
+    :param cpus: доступные ядра
+    :param memory_mb: свободная память в МБ
+    :param footprint: оценка потребления одного браузера
+    :return: решение: количество воркеров и исходные данные для отчёта
+    """
+    per_worker_mb = footprint["peak_rss_mb"] + WORKER_OVERHEAD_MB
+    by_memory = floor(memory_mb * MEMORY_BUDGET_SHARE / per_worker_mb)
+    by_cpu = min(
+        floor(cpus * 100 / max(footprint["cpu_percent"], MIN_BROWSER_CPU_PERCENT)),
+        floor(cpus * MAX_WORKERS_PER_CPU),
+    )
+    return {
+        "workers": max(min(by_memory, by_cpu), 1),
+        "limited_by": "memory" if by_memory < by_cpu else "cpu",
+        "cpus": round(cpus, 1),
+        "available_memory_mb": round(memory_mb),
+        "browser_peak_rss_mb": round(footprint["peak_rss_mb"]),
+        "browser_cpu_percent": round(footprint["cpu_percent"]),
+    }
+
+
+def pytest_xdist_auto_num_workers(config: Config) -> int:
+    """
+    Хук xdist, вызываемый при `-n auto` до запуска воркеров.
+    Кэш pytest к этому моменту ещё не настроен, поэтому открываем его сами
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None and config.pluginmanager.has_plugin("cacheprovider"):
+        cache = Cache.for_config(config, _ispytest=True)
+    decision = choose_workers_count(
+        cpus=available_cpus(),
+        memory_mb=available_memory_mb(),
+        footprint=browser_footprint(
+            cache.get(FOOTPRINT_CACHE_KEY, {}) if cache else {}
+        ),
+    )
+    config.stash[sizing_key] = decision
+    return int(decision["workers"])
+
+
+class BrowserTelemetryCollector:
+    """
+    Сбор телеметрии браузера из свойств отчётов тестов. На контроллере xdist
+    сюда приходят отчёты всех воркеров
+    """
+
+    def __init__(self, config: Config):
+        self._config = config
+        self._started = time.monotonic()
+        self.peak_rss_mb: List[float] = []
+        self.cpu_percent: List[float] = []
+        self.cpu_seconds: List[float] = []
+
+    def pytest_runtest_logreport(self, report: TestReport):
+        if report.when != "call":
+            return
+        properties = dict(report.user_properties)
+        if "browser_peak_rss_mb" not in properties:
+            return
+        self.peak_rss_mb.append(properties["browser_peak_rss_mb"])
+        self.cpu_percent.append(properties["browser_cpu_percent"])
+        self.cpu_seconds.append(
+            properties["browser_cpu_percent"] * properties["sampled_seconds"] / 100
+        )
+
+    def pytest_sessionfinish(self):
+        """Дописывание замеров прогона в историю потребления браузера"""
+        if (
+                hasattr(self._config, "workerinput")
+                or not hasattr(self._config, "cache")
+                or not self.peak_rss_mb
+        ):
+            return
+        history = self._config.cache.get(FOOTPRINT_CACHE_KEY, {})
+        self._config.cache.set(
+            FOOTPRINT_CACHE_KEY,
+            {
+                key: (history.get(key, []) + samples)[-FOOTPRINT_HISTORY_SIZE:]
+                for key, samples in (
+                    ("peak_rss_mb", self.peak_rss_mb),
+                    ("cpu_percent", self.cpu_percent),
+                )
+            },
+        )
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter):
+        """Вывод решения о количестве воркеров и достигнутой утилизации ресурсов"""
+        decision = self._config.stash.get(sizing_key, None)
+        if not decision and not self.peak_rss_mb:
+            return
+        terminalreporter.section("xdist workers sizing")
+        if decision:
+            terminalreporter.line(
+                "workers={workers} (limited by {limited_by}): cpus={cpus}, "
+                "available_memory_mb={available_memory_mb}, "
+                "browser_peak_rss_mb={browser_peak_rss_mb}, "
+                "browser_cpu_percent={browser_cpu_percent}".format(**decision)
+            )
+        if self.peak_rss_mb:
+            # При явном `-n N` решения нет, воркеров столько, сколько задано
+            workers = decision["workers"] if decision else int(
+                getattr(self._config.option, "numprocesses", None) or 1
+            )
+            memory_mb = (
+                decision["available_memory_mb"] if decision else available_memory_mb()
+            )
+            cpus = decision["cpus"] if decision else available_cpus()
+            wall_seconds = time.monotonic() - self._started
+            memory_share = max(self.peak_rss_mb) * workers / memory_mb * 100
+            cpu_share = sum(self.cpu_seconds) / (wall_seconds * cpus) * 100
+            terminalreporter.line(
+                f"achieved: browser_peak_rss_mb={max(self.peak_rss_mb)}, "
+                f"memory_utilization={memory_share:.0f}%, "
+                f"browser_cpu_utilization={cpu_share:.0f}%"
+            )
+
+
+def pytest_configure(config: Config):
+    config.pluginmanager.register(
+        BrowserTelemetryCollector(config), "browser_telemetry_collector"
+    )
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import threading
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Set
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+ARTIFACTS_DIR_NAME = "failure_artifacts"
+ARTIFACTS_INDEX_NAME = "index_{worker}.json"
+DEFAULT_WRITER_THREADS = 2
+# Уже сжатые форматы нет смысла прогонять через gzip ещё раз
+UNCOMPRESSED_EXTENSIONS = ("png",)
+
+
+class ArtifactWriteWarning(UserWarning):
+    """Предупреждение о несохранённых артефактах упавших тестов"""
+
+
+class ArtifactWriter:
+    """
+    Фоновый пул записи артефактов упавших тестов.
+    В teardown синхронно снимаются только сырые байты из драйвера,
+    сжатие, дедупликация и запись на диск выполняются в пуле потоков
+    """
+
+    def __init__(
+            self,
+            directory: str,
+            worker: str = "master",
+            threads: int = DEFAULT_WRITER_THREADS,
+    ):
+        """
+        :param directory: директория для записи артефактов
+        :param worker: имя xdist-воркера, каждый воркер ведёт собственный индекс
+        :param threads: количество потоков записи
+        """
+        self._directory = directory
+        self._worker = worker
+        self._pool = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="artifact-writer"
+        )
+        self._futures: List[Future] = []
+        self._written: Set[str] = set()
+        self._index: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @staticmethod
+    def collect(driver: WebDriver) -> Dict[str, bytes]:
+        """
+        Синхронное снятие сырых артефактов с драйвера
+        :param driver: веб-драйвер упавшего теста
+        :return: словарь вида {имя артефакта с расширением: байты}
+        """
+        raw = {}
+        with contextlib.suppress(Exception):
+            raw["screenshot.png"] = driver.get_screenshot_as_png()
+        with contextlib.suppress(Exception):
+            raw["page_source.html"] = driver.page_source.encode("utf-8")
+        with contextlib.suppress(Exception):
+            raw["browser_log.json"] = json.dumps(
+                driver.get_log("browser"), ensure_ascii=False
+            ).encode("utf-8")
+        return raw
+
+    def submit(self, test_name: str, raw: Dict[str, bytes]) -> Dict[str, str]:
+        """
+        Передача снятых артефактов в пул на запись
+        :param test_name: nodeid упавшего теста
+        :param raw: артефакты, снятые методом `collect`
+        :return: словарь вида {имя артефакта: путь до файла, куда он будет записан}
+        """
+        paths = {}
+        for name, body in raw.items():
+            extension = name.rsplit(".", 1)[-1]
+            file_name = f"{hashlib.sha1(body).hexdigest()}.{extension}"
+            if extension not in UNCOMPRESSED_EXTENSIONS:
+                file_name += ".gz"
+            paths[name] = os.path.join(self._directory, file_name)
+            self._futures.append(
+                self._pool.submit(self._write, test_name, name, paths[name], body)
+            )
+        return paths
+
+    def _write(self, test_name: str, name: str, path: str, body: bytes) -> str:
+        """
+        Запись одного артефакта. Одинаковое содержимое пишется на диск один раз
+        :param test_name: nodeid теста, которому принадлежит артефакт
+        :param name: имя артефакта с расширением
+        :param path: путь до файла артефакта, имя файла - хэш содержимого
+        :param body: сырые байты артефакта
+        :return: путь до файла артефакта
+        """
+        file_name = os.path.basename(path)
+        with self._lock:
+            already_written = path in self._written
+            self._written.add(path)
+
+        if not already_written:
+            try:
+                os.makedirs(self._directory, exist_ok=True)
+                with open(path, "wb") as file:
+                    file.write(
+                        gzip.compress(body, compresslevel=6)
+                        if file_name.endswith(".gz") else body
+                    )
+            except Exception:
+                with self._lock:
+                    self._written.discard(path)
+                raise
+        with self._lock:
+            self._index.setdefault(test_name, []).append(f"{name} → {file_name}")
+        return path
+
+    def flush(self) -> None:
+        """
+        Барьер: дождаться записи всех артефактов и сохранить индекс.
+        Ошибки записи не теряются в пуле, а выводятся предупреждением
+        """
+        done, _ = wait(self._futures)
+        self._futures.clear()
+        if errors := [error for future in done if (error := future.exception())]:
+            warnings.warn(
+                f"{len(errors)} failure artifact(s) were not written to "
+                f"{self._directory}: " + "; ".join(map(repr, errors)),
+                ArtifactWriteWarning,
+                stacklevel=2,
+            )
+        if not self._index:
+            return
+        os.makedirs(self._directory, exist_ok=True)
+        index_path = os.path.join(
+            self._directory, ARTIFACTS_INDEX_NAME.format(worker=self._worker)
+        )
+        index = {}
+        with contextlib.suppress(Exception), open(index_path, encoding="utf-8") as file:
+            index = json.load(file)
+        index |= self._index
+        with open(index_path, "w", encoding="utf-8") as file:
+            json.dump(index, file, ensure_ascii=False, indent=2)
+
+    def shutdown(self) -> None:
+        self.flush()
+        self._pool.shutdown(wait=True)
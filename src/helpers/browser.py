@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import psutil
+
+SAMPLE_INTERVAL = 0.5
+BYTES_IN_MB = 1024 * 1024
+
+# Профили запуска браузера, выбираются опцией `browser_profile` в pytest.ini
+LAUNCH_PROFILES: Dict[str, Tuple[str, ...]] = {
+    "default": (),
+    "lean": (
+        # Процессы рендеринга и изоляция сайтов
+        "renderer-process-limit=1",
+        "disable-site-isolation-trials",
+        "process-per-site",
+        # Ограничение кучи V8 во вкладке
+        "js-flags=--max-old-space-size=256",
+        # Фоновая активность, не нужная тестам
+        "disable-background-networking",
+        "disable-component-update",
+        "disable-default-apps",
+        "disable-sync",
+        "disable-breakpad",
+        "disable-client-side-phishing-detection",
+        "disable-hang-monitor",
+        "disable-domain-reliability",
+        "metrics-recording-only",
+        "no-first-run",
+        "mute-audio",
+        "disable-features=Translate,OptimizationHints,MediaRouter,"
+        "BackForwardCache,AutofillServerCommunication,InterestFeedContentSuggestions",
+        # Троттлинг фоновых вкладок намеренно оставлен включённым ради экономии cpu,
+        # он отключается только в режиме нескольких вкладок (`--tabs`)
+    ),
+}
+
+
+class BrowserResourceSampler:
+    """
+    Фоновый замер памяти и cpu дерева процессов браузера: процесса драйвера
+    и всех его потомков (браузер, рендереры, gpu и т.д.)
+    """
+
+    def __init__(self, root_pid: int, interval: float = SAMPLE_INTERVAL):
+        """
+        :param root_pid: pid процесса chromedriver
+        :param interval: период замеров в секундах
+        """
+        self._root = psutil.Process(root_pid)
+        self._interval = interval
+        self._rss_samples: List[int] = []
+        self._cpu_first: Dict[int, float] = {}
+        self._cpu_last: Dict[int, float] = {}
+        self._started = self._finished = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _processes(self) -> List[psutil.Process]:
+        with contextlib.suppress(psutil.Error):
+            return [self._root, *self._root.children(recursive=True)]
+        return []
+
+    def _sample(self) -> None:
+        rss = 0
+        for process in self._processes():
+            with contextlib.suppress(psutil.Error):
+                with process.oneshot():
+                    rss += process.memory_info().rss
+                    cpu = sum(process.cpu_times()[:2])
+                self._cpu_first.setdefault(process.pid, cpu)
+                self._cpu_last[process.pid] = cpu
+        if rss:
+            self._rss_samples.append(rss)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self._sample()
+
+    def start(self) -> BrowserResourceSampler:
+        self._started = time.monotonic()
+        self._sample()
+        self._thread = threading.Thread(
+            target=self._run, name="browser-sampler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> Dict[str, float]:
+        """
+        Остановка замеров
+        :return: сводка: пиковая и средняя память в МБ, загрузка cpu в %
+        от одного ядра, число процессов и длительность замера
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self._sample()
+        self._finished = time.monotonic()
+        return self.summary()
+
+    def summary(self) -> Dict[str, float]:
+        duration = max((self._finished or time.monotonic()) - self._started, 1e-6)
+        cpu_seconds = sum(
+            self._cpu_last[pid] - self._cpu_first[pid] for pid in self._cpu_last
+        )
+        samples = self._rss_samples or [0]
+        return {
+            "browser_peak_rss_mb": round(max(samples) / BYTES_IN_MB, 1),
+            "browser_mean_rss_mb": round(sum(samples) / len(samples) / BYTES_IN_MB, 1),
+            "browser_cpu_percent": round(cpu_seconds / duration * 100, 1),
+            "browser_processes": len(self._cpu_last),
+            "sampled_seconds": round(duration, 2),
+        }
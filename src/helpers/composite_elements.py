@@ -3,29 +3,53 @@ from __future__ import annotations
 
 from collections import namedtuple
 from dataclasses import dataclass
+from typing import Iterator, Optional
 
 import allure
+from selenium.common.exceptions import StaleElementReferenceException
 
 from src.core import BasePage, BaseElement
+from src.helpers.locators import compiled_xpath
 
-DEFAULT_TIMEOUT = 10
+DEFAULT_CHUNK_SIZE = 500
+# Тексты ячеек строк таблицы с `start` по `start + size` за один вызов драйвера.
+# Значения совпадают с `get_table_as_matrix`: заголовок - как `get_text_of_all`,
+# ячейка - как `cell.text` в lxml (текст до первого нетекстового узла либо null)
+TABLE_CHUNK_SCRIPT = """
+const [table, start, size] = arguments;
+const rows = table.rows;
+const headerText = cell => cell.innerText.replace(/\\u00a0/g, " ").trim();
+const leadingText = cell => {
+    let text = null;
+    for (const node of cell.childNodes) {
+        if (node.nodeType !== Node.TEXT_NODE) { break; }
+        text = (text || "") + node.data;
+    }
+    return text;
+};
+const chunk = [];
+for (let i = start; i < Math.min(start + size, rows.length); i++) {
+    chunk.push(Array.from(rows[i].cells, i === 0 ? headerText : leadingText));
+}
+return chunk;
+"""
 
 
 @dataclass
 class TableLocators:
     table = "//table[ancestor::*[@id='resultSQL']]"
-    table_header = f"{table}//th"
-    table_row = f"{table}//tr"
-    table_column = f"{table}//td"
+    table_header = ".//th"
+    table_row = ".//tr"
+    table_column = ".//td"
 
 
 class Table(BasePage):
     """Комплексный объект таблицы"""
     _locator = TableLocators()
     self = BaseElement(_locator.table)
-    table_header = BaseElement(_locator.table_header)
-    table_row = BaseElement(_locator.table_row)
-    table_column = BaseElement(_locator.table_column)
+    table_header = BaseElement(_locator.table_header, parent=self)
+    table_row = BaseElement(_locator.table_row, parent=self)
+    table_column = BaseElement(_locator.table_column, parent=self)
 
     @allure.step("Получить таблицу результатов")
     def get_table_as_matrix(self) -> tuple[namedtuple, ...]:
@@ -39,12 +63,78 @@ class Table(BasePage):
         >>> row(...),
         >>> )
         """
-        html = self.get_etree()
+        table = self.get_etree(self.self)
         row = namedtuple(
             typename="Row",
             field_names=self.table_header.get_text_of_all()
         )
+        if table is None:
+            return ()
         return tuple(
             row(*(cell.text for cell in line.getchildren()))
-            for line in html.xpath(self._locator.table_row)[1:]
+            for line in compiled_xpath(self._locator.table_row)(table)[1:]
+        )
+
+    def iter_rows(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[namedtuple]:
+        """
+        Потоковое чтение строк отрисованной таблицы порциями по `chunk_size` строк,
+        одна порция - один вызов драйвера. Строки отдаются по мере получения,
+        поэтому прерванный перебор не запрашивает оставшиеся порции
+        :param chunk_size: количество строк в порции
+        :return: генератор именованных кортежей, как в `get_table_as_matrix`
+        :raises: ValueError если в порции меньше одной строки
+        """
+        if chunk_size < 1:
+            raise ValueError(f"{chunk_size=}: a chunk must hold at least one row")
+        return self._iter_rows(chunk_size)
+
+    def _iter_rows(self, chunk_size: int) -> Iterator[namedtuple]:
+        """
+        Генератор `iter_rows`, отделён от проверки аргументов,
+        чтобы неверный `chunk_size` был виден сразу при вызове
+        """
+        if (table := self.self.handle()) is None:
+            return
+        row, start = None, 0
+        while True:
+            for attempt in range(2):
+                try:
+                    chunk = self.driver.execute_script(
+                        TABLE_CHUNK_SCRIPT, table, start, chunk_size
+                    )
+                    break
+                except StaleElementReferenceException:
+                    # Таблица перерисована без изменения поколения DOM - ищем её заново,
+                    # но только до первой порции, иначе смешались бы строки разных таблиц
+                    if attempt or start:
+                        raise
+                    self.self.invalidate_handle()
+                    if (table := self.self.handle()) is None:
+                        return
+            start += (fetched := len(chunk))
+            if row is None and chunk:
+                row = namedtuple(typename="Row", field_names=chunk.pop(0))
+            for cells in chunk:
+                yield row(*cells)
+            if fetched < chunk_size:
+                return
+
+    @allure.step("Найти первую строку таблицы с заданными значениями столбцов")
+    def first_row_where(
+            self,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            **expected: str,
+    ) -> Optional[namedtuple]:
+        """
+        Поиск первой строки с указанными значениями столбцов без чтения всей таблицы
+        :param chunk_size: количество строк в порции
+        :param expected: значения столбцов вида column_name="value"
+        :return: найденная строка либо None
+        """
+        return next(
+            (
+                line for line in self.iter_rows(chunk_size)
+                if all(getattr(line, key) == value for key, value in expected.items())
+            ),
+            None,
         )
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class ExecutorProxy:
+    """
+    Базовая обёртка над `command_executor` веб-драйвера: через неё проходит каждая
+    команда драйвера, включая вызванные изнутри selenium. Наследники
+    переопределяют `execute`, всё остальное делегируется исходному исполнителю
+    """
+
+    def __init__(self, executor: Any):
+        self._executor = executor
+
+    def __getattr__(self, item):
+        return getattr(self._executor, item)
+
+    def execute(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._executor.execute(command, params)
+
+    @classmethod
+    def install(cls, driver: WebDriver, *args, **kwargs) -> ExecutorProxy:
+        """
+        Установка обёртки на веб-драйвер, повторная установка возвращает имеющуюся
+        :param driver: веб-драйвер
+        :return: экземпляр обёртки
+        """
+        executor = driver.command_executor
+        while isinstance(executor, ExecutorProxy):
+            if isinstance(executor, cls):
+                return executor
+            executor = executor._executor
+        proxy = cls(driver.command_executor, *args, **kwargs)
+        driver.command_executor = proxy
+        return proxy
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import threading
+from collections import defaultdict, deque
+from math import ceil
+from typing import Deque, Dict, List, Union
+
+LATENCY_CACHE_KEY = "latency/appearance_times"
+HISTORY_SIZE = 200
+MIN_SAMPLES = 5
+TIMEOUT_PERCENTILE = 0.99
+TIMEOUT_MARGIN = 2
+MIN_TIMEOUT = 2
+DEFAULT_POLL_FREQUENCY = 0.5
+# Каждый опрос условия - запрос к драйверу, чаще 5 раз в секунду опрашивать незачем
+MIN_POLL_FREQUENCY = 0.2
+POLL_DIVIDER = 4
+
+
+def percentile(samples: List[float], share: float) -> float:
+    """
+    Перцентиль по методу ближайшего ранга
+    :param samples: непустой список значений
+    :param share: доля от 0 до 1
+    """
+    ordered = sorted(samples)
+    return ordered[max(ceil(share * len(ordered)) - 1, 0)]
+
+
+class LatencyModel:
+    """
+    Модель времени появления элементов, накопленного за предыдущие прогоны.
+    По истории каждого локатора выводит таймаут ожидания (p99 с запасом) и
+    частоту опроса, пока истории мало - используются значения по умолчанию.
+    Истёкшее ожидание записывается как замер, равный таймауту, иначе после
+    серии быстрых прогонов модель не смогла бы снова увеличить таймаут
+    """
+
+    def __init__(self, history_size: int = HISTORY_SIZE):
+        # Выключается, когда замеры не отражают реальный браузер (воспроизведение записи)
+        self.recording = True
+        self._history_size = history_size
+        self._samples: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=self._history_size)
+        )
+        self._new_samples: Dict[str, List[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def load(self, data: Dict[str, List[float]]) -> None:
+        """
+        Загрузка истории, сохранённой в кэше pytest
+        :param data: словарь вида {локатор: [время появления, ...]}
+        """
+        with self._lock:
+            for locator, samples in data.items():
+                self._samples[locator].extend(samples)
+
+    def merge_into(self, data: Dict[str, List[float]]) -> Dict[str, List[float]]:
+        """
+        Дописывание накопленных за сессию замеров к актуальной истории из кэша.
+        Свежая история перечитывается перед сохранением, чтобы xdist-воркеры
+        не затирали замеры друг друга
+        :param data: история, прочитанная из кэша перед сохранением
+        :return: объединённая история
+        """
+        with self._lock:
+            merged = {locator: list(samples) for locator, samples in data.items()}
+            for locator, samples in self._new_samples.items():
+                merged[locator] = (
+                    merged.get(locator, []) + samples
+                )[-self._history_size:]
+            self._new_samples.clear()
+        return merged
+
+    def record(self, locator: str, seconds: float) -> None:
+        """
+        :param locator: локатор или имя составного ожидания
+        :param seconds: время до выполнения условия ожидания либо таймаут,
+        если условие так и не выполнилось
+        """
+        if not self.recording:
+            return
+        seconds = round(seconds, 3)
+        with self._lock:
+            self._samples[locator].append(seconds)
+            self._new_samples[locator].append(seconds)
+
+    def _history(self, locator: str) -> List[float]:
+        with self._lock:
+            return list(self._samples.get(locator, ()))
+
+    def timeout(
+            self,
+            locator: str,
+            default: Union[int, float],
+    ) -> Union[int, float]:
+        """
+        Таймаут ожидания локатора, не превышающий значения по умолчанию
+        :param locator: локатор или имя составного ожидания
+        :param default: таймаут по умолчанию и одновременно верхняя граница
+        """
+        samples = self._history(locator)
+        if len(samples) < MIN_SAMPLES:
+            return default
+        learned = percentile(samples, TIMEOUT_PERCENTILE) * TIMEOUT_MARGIN
+        return min(max(learned, MIN_TIMEOUT), default)
+
+    def poll_frequency(self, locator: str) -> float:
+        """
+        Частота опроса условия: доля от медианного времени появления
+        :param locator: локатор или имя составного ожидания
+        """
+        samples = self._history(locator)
+        if len(samples) < MIN_SAMPLES:
+            return DEFAULT_POLL_FREQUENCY
+        learned = percentile(samples, 0.5) / POLL_DIVIDER
+        return min(max(learned, MIN_POLL_FREQUENCY), DEFAULT_POLL_FREQUENCY)
+
+
+LATENCY_MODEL = LatencyModel()
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import re
+import warnings
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from lxml import etree
+
+NAME_PATTERN = re.compile(r"^(?:\*|[A-Za-z][\w-]*)$")
+IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][\w-]*$")
+ATTRIBUTE = r"@([A-Za-z_][\w-]*)"
+STRING = r"""(?:'([^']*)'|"([^"]*)")"""
+EQUALS_PREDICATE = re.compile(rf"^{ATTRIBUTE}\s*=\s*{STRING}$")
+HAS_PREDICATE = re.compile(rf"^{ATTRIBUTE}$")
+FUNCTION_PREDICATE = re.compile(
+    rf"^(contains|starts-with)\(\s*{ATTRIBUTE}\s*,\s*{STRING}\s*\)$"
+)
+ANCESTOR_PREDICATE = re.compile(r"^ancestor::(\*|[A-Za-z][\w-]*)(.*)$")
+FIRST_MATCH_WRAPPER = re.compile(r"^\((.+)\)\[1\]$")
+ID_ANCHORED_SCAN = re.compile(r"^//\*\[\s*@id\s*=")
+CSS_OPERATORS = {"contains": "*=", "starts-with": "^="}
+
+_warned_locators = set()
+
+
+class LocatorWarning(UserWarning):
+    """Предупреждение о неоптимальном локаторе"""
+
+
+class CSSLocator:
+    """
+    Результат переписывания xpath-локатора в css-селектор
+    :param selector: эквивалентный css-селектор
+    :param first_only: xpath выбирал только первое совпадение `(...)[1]`,
+    поэтому селектор эквивалентен исходнику лишь при поиске одного элемента
+    """
+
+    def __init__(self, selector: str, first_only: bool = False):
+        self.selector = selector
+        self.first_only = first_only
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.selector!r}, first_only={self.first_only})"
+
+
+def _split_top_level(source: str, separator: str) -> Optional[List[str]]:
+    """
+    Разбиение строки по разделителю вне скобок и кавычек
+    :return: список частей либо None, если скобки не сбалансированы
+    """
+    parts, depth, quote, start, i = [], 0, "", 0, 0
+    while i < len(source):
+        char = source[i]
+        if quote:
+            quote = "" if char == quote else quote
+        elif char in "'\"":
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        elif depth == 0 and source.startswith(separator, i):
+            parts.append(source[start:i])
+            i += len(separator)
+            start = i
+            continue
+        i += 1
+    if depth or quote:
+        return None
+    parts.append(source[start:])
+    return parts
+
+
+def _split_predicates(step: str) -> Optional[Tuple[str, List[str]]]:
+    """
+    Разбиение шага xpath на имя узла и список предикатов
+    :return: (имя, [предикат, ...]) либо None, если шаг не разбирается
+    """
+    name_end = step.find("[")
+    name, rest = (step, "") if name_end < 0 else (step[:name_end], step[name_end:])
+    predicates, depth, quote, start = [], 0, "", 0
+    for i, char in enumerate(rest):
+        if quote:
+            quote = "" if char == quote else quote
+        elif char in "'\"":
+            quote = char
+        elif char == "[":
+            depth += 1
+            if depth == 1:
+                start = i + 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                predicates.append(rest[start:i].strip())
+            elif depth < 0:
+                return None
+        elif depth == 0:
+            return None
+    if depth or quote:
+        return None
+    return name.strip(), predicates
+
+
+def _attribute_selector(predicate: str) -> Optional[str]:
+    """Перевод предиката по атрибуту в css, для прочих предикатов - None"""
+    if match := EQUALS_PREDICATE.match(predicate):
+        attribute, value = match.group(1), match.group(2) or match.group(3) or ""
+        if '"' in value or "\\" in value:
+            return None
+        if attribute == "id" and IDENTIFIER_PATTERN.match(value):
+            return f"#{value}"
+        return f'[{attribute}="{value}"]'
+    if match := HAS_PREDICATE.match(predicate):
+        return f"[{match.group(1)}]"
+    if match := FUNCTION_PREDICATE.match(predicate):
+        function, attribute = match.group(1), match.group(2)
+        value = match.group(3) or match.group(4) or ""
+        # С пустой строкой xpath-функция истинна для любого узла, а css - ни для одного
+        if not value or '"' in value or "\\" in value:
+            return None
+        return f'[{attribute}{CSS_OPERATORS[function]}"{value}"]'
+    return None
+
+
+def _compound_selector(step: str) -> Optional[Tuple[str, str]]:
+    """
+    Перевод шага xpath в составной css-селектор
+    :return: (селектор узла, селектор предка из `ancestor::`) либо None
+    """
+    if (parsed := _split_predicates(step)) is None:
+        return None
+    name, predicates = parsed
+    if not NAME_PATTERN.match(name):
+        return None
+    selector, ancestor = "" if name == "*" else name, ""
+    for predicate in predicates:
+        if match := ANCESTOR_PREDICATE.match(predicate):
+            if ancestor or (parsed_ancestor := _compound_selector(
+                    match.group(1) + match.group(2)
+            )) is None or parsed_ancestor[1]:
+                return None
+            ancestor = parsed_ancestor[0]
+        elif (attribute := _attribute_selector(predicate)) is not None:
+            selector += attribute
+        else:
+            return None
+    return selector or "*", ancestor
+
+
+@lru_cache(maxsize=None)
+def xpath_to_css(xpath: str) -> Optional[CSSLocator]:
+    """
+    Переписывание xpath-локатора в эквивалентный css-селектор.
+    Поддерживаются шаги по потомкам и детям с предикатами по атрибутам
+    (`=`, `contains`, `starts-with`, наличие атрибута) и `ancestor::` у первого шага.
+    Относительный путь из нескольких шагов привязывается к элементу-контексту
+    через `:scope`: иначе css сопоставил бы первый шаг и с самим контекстом
+    либо с его предками
+    :param xpath: xpath-локатор
+    :return: css-локатор либо None, если эквивалентного селектора нет
+    """
+    xpath, first_only = xpath.strip(), False
+    if match := FIRST_MATCH_WRAPPER.match(xpath):
+        xpath, first_only = match.group(1).strip(), True
+
+    if relative := xpath.startswith(".//"):
+        xpath = xpath[1:]
+    if not xpath.startswith("//"):
+        return None
+    if (descendants := _split_top_level(xpath[2:], "//")) is None:
+        return None
+
+    selectors, steps, anchored_on_ancestor = [], 0, False
+    for position, descendant in enumerate(descendants):
+        if (children := _split_top_level(descendant, "/")) is None:
+            return None
+        compounds = []
+        for step in children:
+            if (compound := _compound_selector(step)) is None:
+                return None
+            selector, ancestor = compound
+            if ancestor and (position or compounds):
+                return None
+            steps += 1
+            anchored_on_ancestor |= bool(ancestor)
+            compounds.append(f"{ancestor} {selector}" if ancestor else selector)
+        selectors.append(" > ".join(compounds))
+    if relative and steps > 1:
+        # Предок из `ancestor::` может быть и вне контекста, `:scope` это запретил бы
+        if anchored_on_ancestor:
+            return None
+        selectors.insert(0, ":scope")
+    return CSSLocator(" ".join(selectors), first_only=first_only)
+
+
+def warn_unanchored_scan(xpath: str) -> None:
+    """
+    Предупреждение о локаторе, начинающемся со сканирования всего документа `//*`.
+    Шаг `//*[@id=...]` уже привязан к id и не считается сканированием
+    :param xpath: xpath-локатор
+    """
+    if xpath in _warned_locators:
+        return
+    first_step = xpath.lstrip("(")
+    if first_step.startswith("//*") and not ID_ANCHORED_SCAN.match(first_step):
+        _warned_locators.add(xpath)
+        warnings.warn(
+            f"Locator {xpath!r} scans the whole document with `//*`, "
+            f"anchor it on a tag or an element with id",
+            LocatorWarning,
+            stacklevel=3,
+        )
+
+
+@lru_cache(maxsize=None)
+def compiled_xpath(xpath: str) -> etree.XPath:
+    """
+    Общий для процесса кэш скомпилированных xpath-выражений для разбора
+    html-исходника на стороне python
+    :param xpath: xpath-выражение
+    """
+    return etree.XPath(xpath)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Tuple
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.errorhandler import ErrorCode
+
+from src.helpers.executors import ExecutorProxy
+from src.helpers.latency import MIN_POLL_FREQUENCY
+
+# Время жизни ответа меньше минимального интервала опроса ожиданий, поэтому каждый
+# опрос `url_changes`, `title_is` и т.п. видит свежее значение, а кэш схлопывает
+# только повторные чтения внутри одного шага
+MEMO_TTL = MIN_POLL_FREQUENCY / 2
+
+# Идемпотентные чтения, ответ на которые кэшируется до изменяющей команды
+MEMOIZED_COMMANDS = frozenset((
+    Command.GET_CURRENT_URL,
+    Command.GET_TITLE,
+    Command.GET_WINDOW_RECT,
+    Command.GET_TIMEOUTS,
+    Command.W3C_GET_CURRENT_WINDOW_HANDLE,
+    Command.W3C_GET_WINDOW_HANDLES,
+))
+# Чтения, которые не меняют ни страницу, ни состояние сессии и не сбрасывают кэш
+READ_ONLY_COMMANDS = frozenset((
+    Command.FIND_ELEMENT,
+    Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT,
+    Command.FIND_CHILD_ELEMENTS,
+    Command.GET_ELEMENT_TEXT,
+    Command.GET_ELEMENT_TAG_NAME,
+    Command.GET_ELEMENT_RECT,
+    Command.GET_ELEMENT_ATTRIBUTE,
+    Command.GET_ELEMENT_PROPERTY,
+    Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY,
+    Command.IS_ELEMENT_SELECTED,
+    Command.IS_ELEMENT_ENABLED,
+    Command.GET_PAGE_SOURCE,
+    Command.SCREENSHOT,
+    Command.ELEMENT_SCREENSHOT,
+    Command.GET_LOG,
+    Command.GET_AVAILABLE_LOG_TYPES,
+    Command.GET_ALL_COOKIES,
+    Command.GET_COOKIE,
+))
+
+
+class MemoizingExecutor(ExecutorProxy):
+    """
+    Исполнитель, кэширующий ответы на идемпотентные чтения (урл, заголовок,
+    размер окна, таймауты, вкладки). Любая другая команда, кроме заведомо
+    читающих, считается способной изменить страницу и сбрасывает кэш.
+    Навигацию, инициированную самой страницей без команд драйвера, кэш не видит,
+    поэтому ответ живёт не дольше `ttl` секунд
+    """
+
+    def __init__(self, executor: Any, ttl: float = MEMO_TTL):
+        """
+        :param executor: исходный исполнитель команд
+        :param ttl: время жизни закэшированного ответа в секундах
+        """
+        super().__init__(executor)
+        self._ttl = ttl
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+
+    def execute(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            if command in MEMOIZED_COMMANDS:
+                stored_at, cached = self._cache.get(command, (0.0, None))
+                if cached is not None and time.monotonic() - stored_at < self._ttl:
+                    self.hits[command] += 1
+                    # Копия: веб-драйвер подменяет значение в полученном ответе
+                    return dict(cached)
+                self.misses[command] += 1
+            elif command not in READ_ONLY_COMMANDS:
+                self._cache.clear()
+
+            response = self._executor.execute(command, params)
+            if command in MEMOIZED_COMMANDS and not self._is_error(response):
+                self._cache[command] = time.monotonic(), dict(response)
+            return response
+
+    @staticmethod
+    def _is_error(response: Any) -> bool:
+        """
+        Ошибка в ответе исполнителя: RemoteConnection отдаёт её с http-статусом
+        и телом ответа строкой, а не разобранным словарём `{"error": ...}`
+        """
+        if not isinstance(response, dict):
+            return False
+        if response.get("status") not in (None, ErrorCode.SUCCESS):
+            return True
+        value = response.get("value")
+        return isinstance(value, dict) and "error" in value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits.clear()
+            self.misses.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Попадания и промахи кэша по командам"""
+        with self._lock:
+            result = {"memo_hits": sum(self.hits.values())}
+            result["memo_misses"] = sum(self.misses.values())
+            result |= {f"memo_hits.{command}": count for command, count in self.hits.items()}
+            return result
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.helpers.executors import ExecutorProxy
+
+RECORDING_EXTENSION = ".jsonl.gz"
+# Команды, на которые при воспроизведении отвечаем пустым ответом без записи
+SILENT_COMMANDS = (Command.QUIT, Command.CLOSE)
+
+
+def recording_path(directory: str, test_name: str) -> str:
+    """
+    Путь до файла записи теста
+    :param directory: директория с записями
+    :param test_name: nodeid теста
+    """
+    file_name = re.sub(r"[^\w.-]+", "_", test_name).strip("_")
+    return os.path.join(directory, file_name + RECORDING_EXTENSION)
+
+
+def command_key(command: str, params: Optional[Dict[str, Any]]) -> str:
+    """
+    Ключ команды для сопоставления с записью: имя команды и параметры без
+    идентификатора сессии. Параметры создания сессии не учитываются
+    """
+    if command == Command.NEW_SESSION:
+        return command
+    params = {key: value for key, value in (params or {}).items() if key != "sessionId"}
+    return json.dumps([command, params], sort_keys=True, ensure_ascii=False)
+
+
+class ReplayMismatch(WebDriverException):
+    """В записи нет ответа на команду веб-драйвера"""
+
+
+class RecordingExecutor(ExecutorProxy):
+    """Исполнитель, записывающий поток команд веб-драйвера и ответов на них"""
+
+    def __init__(self, executor: Any):
+        super().__init__(executor)
+        self._lines: List[str] = []
+
+    @staticmethod
+    def _line(key: str, response: Dict[str, Any]) -> str:
+        return json.dumps([key, response], ensure_ascii=False)
+
+    def execute(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        response = self._executor.execute(command, params)
+        # Сериализуем сразу: веб-драйвер подменяет в ответе элементы на WebElement
+        self._lines.append(self._line(command_key(command, params), response))
+        return response
+
+    def record_session(self, driver: WebDriver) -> None:
+        """
+        Запись ответа на создание сессии: сессия создаётся до установки обёртки
+        :param driver: записываемый веб-драйвер
+        """
+        self._lines.insert(
+            0,
+            self._line(
+                command_key(Command.NEW_SESSION, None),
+                {"value": {"sessionId": driver.session_id, "capabilities": driver.caps}},
+            ),
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Сохранение записи в сжатый jsonl-файл: одна строка - одна команда
+        :param path: путь до файла записи
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            file.writelines(line + "\n" for line in self._lines)
+        self._lines.clear()
+
+
+class ReplayExecutor:
+    """
+    Исполнитель, отвечающий на команды веб-драйвера из записи без браузера.
+    Ответы на одинаковые команды отдаются в порядке записи, последний ответ
+    повторяется, поэтому разное число опросов в ожиданиях не ломает воспроизведение
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: путь до файла записи
+        """
+        self._responses: Dict[str, Deque[str]] = {}
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                key, response = json.loads(line)
+                self._responses.setdefault(key, deque()).append(
+                    json.dumps(response, ensure_ascii=False)
+                )
+
+    def execute(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        key = command_key(command, params)
+        if not (responses := self._responses.get(key)):
+            if command in SILENT_COMMANDS:
+                return {"value": None}
+            raise ReplayMismatch(f"Recording has no response for {key}")
+        # Каждый раз новый объект: веб-драйвер изменяет полученный ответ
+        return json.loads(responses.popleft() if len(responses) > 1 else responses[0])
+
+    def close(self) -> None:
+        """Совместимость с RemoteConnection: закрывать нечего"""
+
+
+class ReplayDriver(WebDriver):
+    """
+    Веб-драйвер, воспроизводящий записанный прогон без браузера.
+    Совместим с `SingletonDriver` и фикстурой `driver_class` из pytest-selenium
+    """
+    # Ответы записи приходят мгновенно, ждать загрузки страницы между проверками незачем
+    page_load_poll = 0
+
+    def __init__(self, recording: str, options: Optional[ChromeOptions] = None, **_):
+        """
+        :param recording: путь до файла записи
+        :param options: опции браузера, используются только для создания сессии
+        """
+        super().__init__(
+            command_executor=ReplayExecutor(recording),
+            options=options or ChromeOptions(),
+        )
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+import allure
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+DEFAULT_STEP_ATTEMPTS = 3
+DEFAULT_STEP_BACKOFF = 0.5
+
+
+class ElementNotFound(AttributeError):
+    """
+    Базовый элемент не найден. Наследует AttributeError, которым элементы
+    сообщали об этом раньше, чтобы не сломать его обработку в вызывающем коде
+    """
+
+
+RETRYABLE_EXCEPTIONS = (
+    ElementNotFound,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+_retry_depth = threading.local()
+
+
+class StepRetryStats:
+    """
+    Статистика повторов шагов в рамках теста: сколько было повторов и сколько
+    времени они сэкономили по сравнению с перезапуском теста целиком
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.test_started = time.monotonic()
+            self.retries = 0
+            self.retry_seconds = 0.0
+            self.rerun_seconds = 0.0
+
+    def record(self, failed_at: float, retry_seconds: float) -> None:
+        """
+        :param failed_at: момент неудачной попытки, всё до него повторил бы перезапуск
+        :param retry_seconds: время, потраченное на повтор шага
+        """
+        with self._lock:
+            self.retries += 1
+            self.retry_seconds += retry_seconds
+            self.rerun_seconds += failed_at - self.test_started
+
+    def summary(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "step_retries": self.retries,
+                "step_retry_seconds": round(self.retry_seconds, 2),
+                "step_retry_saved_seconds": round(
+                    self.rerun_seconds - self.retry_seconds, 2
+                ),
+            }
+
+
+RETRY_STATS = StepRetryStats()
+
+
+def retry_step(
+        attempts: int = DEFAULT_STEP_ATTEMPTS,
+        backoff: float = DEFAULT_STEP_BACKOFF,
+        retry_on_falsy: bool = False,
+        restore: bool = True,
+) -> Callable:
+    """
+    Декоратор повтора действия page object вместо перезапуска всего теста.
+    Перед первой попыткой снимается контрольная точка страницы, перед каждым
+    повтором она восстанавливается и перепроверяются условия загрузки страницы.
+    Точка снимается до действия, чтобы повтор начинался с исходного состояния,
+    а не с оставленного неудачной попыткой: это запросы к драйверу и для
+    успешных действий, поэтому ожиданиям, которым восстанавливать нечего,
+    нужен `restore=False`. Повторяется только внешнее действие, вложенные
+    выполняются один раз
+    :param attempts: максимальное количество попыток
+    :param backoff: пауза перед первым повтором, удваивается с каждой попыткой
+    :param retry_on_falsy: повторять и при ложном результате действия
+    :param restore: восстанавливать контрольную точку перед повтором, без
+    восстановления повтор - просто пауза и повторный вызов
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapped(self, *args, **kwargs) -> Any:
+            if getattr(_retry_depth, "value", 0):
+                return func(self, *args, **kwargs)
+
+            page = getattr(self, "_page", None) or self
+            checkpoint = page.checkpoint() if restore else None
+            _retry_depth.value = 1
+            try:
+                for attempt in range(1, attempts + 1):
+                    error: Optional[Exception] = None
+                    try:
+                        result = func(self, *args, **kwargs)
+                        if result or not retry_on_falsy:
+                            return result
+                    except RETRYABLE_EXCEPTIONS as exception:
+                        error = exception
+                    if attempt == attempts:
+                        if error:
+                            raise error
+                        return result
+
+                    failed_at = time.monotonic()
+                    with allure.step(
+                            f"Повтор шага {func.__name__}: попытка {attempt + 1}"
+                    ):
+                        if error:
+                            allure.attach(name=type(error).__name__, body=str(error))
+                        time.sleep(backoff * 2 ** (attempt - 1))
+                        if restore:
+                            page.restore(checkpoint)
+                    RETRY_STATS.record(failed_at, time.monotonic() - failed_at)
+            finally:
+                _retry_depth.value = 0
+
+        return wrapped
+
+    return decorator
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import threading
 from typing import Optional
 
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -16,4 +17,38 @@ class SingletonDriver:
     @classmethod
     def clear_instance(cls):
         cls.__instance = None
+        DomGeneration.bump()
         return cls.__instance
+
+
+class DomGeneration:
+    """
+    Счётчик поколений DOM: увеличивается при каждом действии, способном изменить
+    страницу, и служит ключом для кэшей, привязанных к состоянию страницы
+    """
+    __value = 0
+
+    @classmethod
+    def current(cls) -> int:
+        return cls.__value
+
+    @classmethod
+    def bump(cls) -> int:
+        cls.__value += 1
+        return cls.__value
+
+
+class CurrentTab:
+    """
+    Вкладка браузера, к которой привязан текущий поток при мультиплексировании
+    сценариев по вкладкам одного веб-драйвера
+    """
+    __context = threading.local()
+
+    @classmethod
+    def get(cls) -> Optional[str]:
+        return getattr(cls.__context, "handle", None)
+
+    @classmethod
+    def set(cls, handle: Optional[str]) -> None:
+        cls.__context.handle = handle
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, SimpleQueue
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import allure
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.core import BasePage
+from src.helpers.executors import ExecutorProxy
+from src.helpers.singletons import CurrentTab
+
+Scenario = Callable[[BasePage], Any]
+
+
+class TabSwitchingExecutor(ExecutorProxy):
+    """
+    Исполнитель команд, переключающий драйвер на вкладку текущего потока перед
+    каждой командой. Команды разных вкладок сериализуются, а ожидания между ними
+    (поллинг, sleep) выполняются параллельно
+    """
+
+    def __init__(self, executor: Any):
+        super().__init__(executor)
+        self._lock = threading.RLock()
+        self._active: Optional[str] = None
+
+    def execute(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            handle = CurrentTab.get()
+            if handle and handle != self._active and command != Command.SWITCH_TO_WINDOW:
+                self._executor.execute(
+                    Command.SWITCH_TO_WINDOW,
+                    {"handle": handle, "sessionId": params.get("sessionId")},
+                )
+                self._active = handle
+            response = self._executor.execute(command, params)
+            if command == Command.SWITCH_TO_WINDOW:
+                self._active = params.get("handle")
+            return response
+
+
+class TabScenarioError(AssertionError):
+    """Ошибка одного или нескольких сценариев, выполненных во вкладках"""
+
+    def __init__(self, failures: List[Tuple[int, BaseException]]):
+        self.failures = failures
+        details = "\n".join(
+            f"scenario #{index}:\n" + "".join(
+                traceback.format_exception(type(error), error, error.__traceback__)
+            )
+            for index, error in failures
+        )
+        super().__init__(f"{len(failures)} scenario(s) failed:\n{details}")
+
+
+class TabScheduler:
+    """
+    Планировщик независимых сценариев по вкладкам одного браузера.
+    Каждая вкладка обслуживается своим потоком, пока один сценарий ждёт сеть
+    или загрузку страницы, команды шлют другие.
+
+    Ограничения:
+    - базовые элементы страниц объявлены на классе и общие для всех экземпляров,
+      поэтому `_page` элемента указывает на страницу, обратившуюся к нему последней,
+      и «своя страница у вкладки» лишь номинальна. Команды при этом уходят во
+      вкладку текущего потока, а не страницы, поэтому это безопасно, пока страница
+      не хранит состояния в атрибутах экземпляра;
+    - шаги allure из потоков попадают в отчёт только потому, что allure-pytest
+      (2.13) начинает контекст нового потока с последнего открытого шага основного
+      потока. Поэтому `run` - шаг отчёта, а каждый сценарий - вложенный в него шаг
+    """
+
+    def __init__(
+            self,
+            driver: WebDriver,
+            tabs: int,
+            page_factory: Callable[[], BasePage],
+    ):
+        """
+        :param driver: веб-драйвер
+        :param tabs: количество вкладок
+        :param page_factory: фабрика страницы, к которой привязывается вкладка
+        """
+        self._driver = driver
+        self._tabs = max(tabs, 1)
+        self._page_factory = page_factory
+        self._handles: List[str] = []
+        self._main_handle: Optional[str] = None
+
+    @property
+    def handles(self) -> List[str]:
+        return list(self._handles)
+
+    def open(self) -> List[str]:
+        """Открытие вкладок, первой вкладкой служит уже открытое окно"""
+        if self._handles:
+            return self.handles
+        TabSwitchingExecutor.install(self._driver)
+        self._main_handle = self._driver.current_window_handle
+        self._handles.append(self._main_handle)
+        for _ in range(self._tabs - 1):
+            self._driver.switch_to.new_window("tab")
+            self._handles.append(self._driver.current_window_handle)
+        self._driver.switch_to.window(self._main_handle)
+        return self.handles
+
+    @allure.step("Выполнить сценарии во вкладках")
+    def run(self, scenarios: Sequence[Scenario]) -> List[Any]:
+        """
+        Выполнение сценариев с чередованием по вкладкам
+        :param scenarios: функции, принимающие страницу, привязанную к вкладке
+        :return: результаты сценариев в порядке их передачи, драйвер при этом
+        снова переключён на исходную вкладку
+        :raises: TabScenarioError если упал хотя бы один сценарий
+        """
+        self.open()
+        queue: SimpleQueue = SimpleQueue()
+        for index, scenario in enumerate(scenarios):
+            queue.put((index, scenario))
+        results: List[Any] = [None] * len(scenarios)
+        failures: List[Tuple[int, BaseException]] = []
+        outcomes: List[str] = [""] * len(scenarios)
+
+        def serve(tab: int, handle: str):
+            CurrentTab.set(handle)
+            page = self._page_factory()
+            try:
+                while True:
+                    try:
+                        index, scenario = queue.get_nowait()
+                    except Empty:
+                        return
+                    started, outcome = time.monotonic(), "ok"
+                    try:
+                        with allure.step(f"Сценарий #{index} во вкладке {tab}"):
+                            results[index] = scenario(page)
+                    except Exception as error:
+                        failures.append((index, error))
+                        outcome = f"{type(error).__name__}: {error}"
+                    outcomes[index] = (
+                        f"#{index} tab={tab} "
+                        f"{time.monotonic() - started:.2f} s: {outcome}"
+                    )
+            finally:
+                CurrentTab.set(None)
+
+        try:
+            with ThreadPoolExecutor(
+                    max_workers=len(self._handles), thread_name_prefix="tab"
+            ) as pool:
+                for future in [
+                    pool.submit(serve, tab, handle)
+                    for tab, handle in enumerate(self._handles)
+                ]:
+                    future.result()
+        finally:
+            # Основной поток продолжает тест в исходной вкладке, а не в последней
+            # использованной сценариями
+            self._driver.switch_to.window(self._main_handle)
+
+        allure.attach(
+            name="Сценарии во вкладках",
+            body="\n".join(outcomes),
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        if failures:
+            raise TabScenarioError(sorted(failures, key=lambda failure: failure[0]))
+        return results
+
+    def close(self) -> None:
+        """Закрытие дополнительных вкладок и возврат на исходную"""
+        for handle in self._handles:
+            if handle == self._main_handle:
+                continue
+            self._driver.switch_to.window(handle)
+            self._driver.close()
+        if self._main_handle:
+            self._driver.switch_to.window(self._main_handle)
+        self._handles.clear()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import itertools
+import json
+import os
+import threading
+from importlib.metadata import version
+from typing import Dict, List, Optional
+
+DEFAULT_POOL_SIZE = 1000
+DEFAULT_SEED = 1337
+# Колонки таблицы Customers и провайдеры Faker, которыми они заполняются
+CUSTOMER_COLUMNS: Dict[str, str] = {
+    "CustomerName": "name",
+    "ContactName": "name",
+    "Address": "street_address",
+    "City": "city",
+    "PostalCode": "postcode",
+    "Country": "country",
+}
+
+
+def sql_literal(value) -> str:
+    """Строковый sql-литерал с экранированием одинарных кавычек"""
+    return "'%s'" % str(value).replace("'", "''")
+
+
+def sql_values(row: Dict[str, str]) -> str:
+    """Часть insert-запроса вида `(col1, col2) values ('a', 'b')`"""
+    columns = ", ".join(row)
+    values = ", ".join(sql_literal(value) for value in row.values())
+    return f"({columns}) values ({values})"
+
+
+def sql_assignments(row: Dict[str, str]) -> str:
+    """Часть update-запроса вида `col1 = 'a', col2 = 'b'`"""
+    return ", ".join(f"{column} = {sql_literal(value)}" for column, value in row.items())
+
+
+class DataPool:
+    """
+    Пул тестовых данных, сгенерированных пачкой с фиксированным сидом.
+    Пул кэшируется на диске между прогонами, строки выдаются по индексу за O(1),
+    xdist-воркеры берут непересекающиеся строки (каждую N-ую со своим смещением)
+    """
+
+    def __init__(
+            self,
+            columns: Dict[str, str],
+            size: int = DEFAULT_POOL_SIZE,
+            seed: int = DEFAULT_SEED,
+            cache_dir: Optional[str] = None,
+            worker_index: int = 0,
+            workers_count: int = 1,
+    ):
+        """
+        :param columns: словарь вида {колонка: имя провайдера Faker}
+        :param size: количество строк в пуле
+        :param seed: сид генерации
+        :param cache_dir: директория дискового кэша пулов
+        :param worker_index: номер xdist-воркера
+        :param workers_count: количество xdist-воркеров
+        """
+        self._columns = columns
+        self._size = size
+        self._seed = seed
+        self._cache_dir = cache_dir
+        self._pools: Dict[str, List[str]] = {}
+        self._indexes = itertools.count(worker_index, max(workers_count, 1))
+        self._lock = threading.Lock()
+
+    @property
+    def cache_path(self) -> Optional[str]:
+        if not self._cache_dir:
+            return None
+        key = json.dumps(
+            [self._columns, self._size, self._seed, version("Faker")], sort_keys=True
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._cache_dir, f"pool-{digest}.json")
+
+    def load(self) -> DataPool:
+        """Загрузка пула из дискового кэша либо его генерация"""
+        if path := self.cache_path:
+            with contextlib.suppress(Exception), open(path, encoding="utf-8") as file:
+                self._pools = json.load(file)
+        if not self._pools or set(self._pools) != set(self._columns):
+            self._pools = self._generate()
+            if path:
+                # Запись через временный файл: пул могут одновременно писать воркеры
+                temporary_path = f"{path}.{os.getpid()}"
+                with open(temporary_path, "w", encoding="utf-8") as file:
+                    json.dump(self._pools, file, ensure_ascii=False)
+                os.replace(temporary_path, path)
+        return self
+
+    def _generate(self) -> Dict[str, List[str]]:
+        """Генерация колонок пула пачкой одним экземпляром Faker"""
+        # Faker импортируется только при промахе кэша: загрузка провайдеров дорогая
+        from faker import Faker
+
+        fake = Faker()
+        fake.seed_instance(self._seed)
+        return {
+            column: [str(getattr(fake, provider)()) for _ in range(self._size)]
+            for column, provider in self._columns.items()
+        }
+
+    def row(self) -> Dict[str, str]:
+        """
+        Следующая неиспользованная строка пула
+        :raises: UserWarning если пул исчерпан
+        """
+        if not self._pools:
+            self.load()
+        with self._lock:
+            index = next(self._indexes)
+        if index >= self._size:
+            raise UserWarning(
+                f"Data pool of {self._size} rows is exhausted, increase its size"
+            )
+        return {column: self._pools[column][index] for column in self._columns}
@@ -1,16 +1,62 @@
 # -*- coding: utf-8 -*-
 from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
 
 import allure
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
 
 from src.core import BasePage, BaseElement
 from src.helpers.composite_elements import Table
+from src.helpers.retry import retry_step
+from src.helpers.singletons import DomGeneration
 
 
 @dataclass
 class SQLLocators:
-    query_input = '(//*[contains(@class, "CodeMirror")])[1]'
+    query_input = '(//div[contains(@class, "CodeMirror")])[1]'
     run_button = '//button[contains(text(), "Run SQL")]'
+    output_msg = '//*[@id="resultSQL"]'
+
+
+# Наблюдатель за блоком результатов, включаемый перед нажатием "Run SQL":
+# отмечает любую перерисовку блока, чтобы результат прошлого запуска
+# (или стартовая подсказка песочницы) не принимался за результат текущего
+ARM_OUTPUT_SCRIPT = """
+const output = document.evaluate(
+    arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+if (window.__resultObserver) { window.__resultObserver.disconnect(); }
+window.__resultRendered = false;
+window.__resultOutput = output;
+if (output) {
+    window.__resultObserver = new MutationObserver(() => { window.__resultRendered = true; });
+    window.__resultObserver.observe(
+        output, {childList: true, subtree: true, characterData: true}
+    );
+}
+"""
+# Блок результатов перерисован после включения наблюдателя либо заменён целиком
+OUTPUT_RENDERED_CONDITION = (
+    "window.__resultRendered === true"
+    " || (!!window.__resultOutput && !window.__resultOutput.isConnected)"
+)
+OUTPUT_RENDERED_SCRIPT = f"return {OUTPUT_RENDERED_CONDITION};"
+# Текст перерисованного блока результатов, если в нём нет таблицы
+# (сообщение об изменениях/ошибке)
+OUTPUT_MESSAGE_SCRIPT = f"""
+if (!({OUTPUT_RENDERED_CONDITION})) {{ return null; }}
+const output = document.evaluate(
+    arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+if (!output || output.querySelector("table")) {{ return null; }}
+return output.innerText.trim() || null;
+"""
+QUERY_RESULT_TIMEOUT = 4
+QUERY_RESULT_KEY = "send_and_confirm_query"
+GET_EDITOR_VALUE_SCRIPT = "return window.editor ? window.editor.getDoc().getValue() : null;"
+SET_EDITOR_VALUE_SCRIPT = "window.editor.getDoc().setValue(arguments[0]);"
 
 
 class SQLPage(BasePage):
@@ -32,18 +78,72 @@ class SQLPage(BasePage):
         query = query.replace('"', "'")
         script = f'window.editor.getDoc().setValue("{query}")'
         self.driver.execute_script(script)
+        DomGeneration.bump()
         return self.query_input.get_text() == query
 
+    def checkpoint(self) -> Dict[str, Any]:
+        """Контрольная точка страницы вместе с содержимым редактора"""
+        return {
+            **super().checkpoint(),
+            "query": self.driver.execute_script(GET_EDITOR_VALUE_SCRIPT),
+        }
+
+    def restore(self, checkpoint: Dict[str, Any]) -> None:
+        super().restore(checkpoint)
+        if checkpoint.get("query") is not None:
+            self.driver.execute_script(SET_EDITOR_VALUE_SCRIPT, checkpoint["query"])
+
     @allure.step("Отправить и подтвердить SQL запрос")
     def send_and_confirm_query(self, query: str, via_editor: bool = False) -> bool:
         """
         Метод ввода sql-запроса как эмуляцией ввода с клавиатуры так и через
-        `window.editor` объект
+        `window.editor` объект.
+        После нажатия "Run SQL" запрос уже выполнен, и повторная отправка выполнила
+        бы изменяющий запрос дважды, поэтому повторяется только ожидание результата.
+        Заново нажимается кнопка только если не удался сам клик (повтор `click`).
+        Перед нажатием включается наблюдатель за блоком результатов: таблица
+        или сообщение засчитываются, только если блок перерисован этим запуском
         :param query: sql-запрос
         :param via_editor: флаг выбора способа ввода, по-умолчанию через клавиатуру
         :return: ui-подтверждение успеха обработки запроса страницей
         """
         self._insert_query(query) if via_editor else self.query_input.send_keys(query)
+        self.driver.execute_script(ARM_OUTPUT_SCRIPT, self._locator.output_msg)
         self.run_button.click()
-        output_msg = self.make_base_element('//*[@id="resultSQL"]')
-        return self.result_table.self.find(2) or output_msg.get_text(2)
+        return self._wait_query_result()
+
+    @retry_step(retry_on_falsy=True, restore=False)
+    def _wait_query_result(self) -> Optional[Any]:
+        """
+        Ожидание таблицы либо сообщения в блоке результатов
+        :return: найденная таблица, текст сообщения либо None
+        """
+        _, result = self.wait_first(
+            {
+                "table": self._get_result_table,
+                "message": self._get_output_message,
+            },
+            key=QUERY_RESULT_KEY,
+            default_timeout=QUERY_RESULT_TIMEOUT,
+        )
+        return result
+
+    def _get_result_table(self, driver: WebDriver) -> Union[WebElement, bool]:
+        """
+        Условие ожидания таблицы, отрисованной текущим запуском запроса
+        :param driver: веб-драйвер
+        :return: веб-элемент таблицы или False, если её ещё нет
+        """
+        if not driver.execute_script(OUTPUT_RENDERED_SCRIPT):
+            return False
+        return EC.presence_of_element_located(
+            self.result_table.self.lookup_locator
+        )(driver)
+
+    def _get_output_message(self, driver: WebDriver) -> Optional[str]:
+        """
+        Условие ожидания сообщения в блоке результатов вместо таблицы
+        :param driver: веб-драйвер
+        :return: текст сообщения или None, если его ещё нет
+        """
+        return driver.execute_script(OUTPUT_MESSAGE_SCRIPT, self._locator.output_msg)
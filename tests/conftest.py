@@ -7,13 +7,41 @@ from _pytest.config.argparsing import Parser
 
 WINDOW_DEFAULT_SIZE = (1600, 900)
 
-pytest_plugins = ["src.fixtures.selenium", "src.fixtures.pages"]
+pytest_plugins = [
+    "src.fixtures.selenium",
+    "src.fixtures.pages",
+    "src.fixtures.latency",
+    "src.fixtures.workers",
+    "src.fixtures.test_data",
+]
 
 
 def pytest_addoption(parser: Parser):
     parser.addoption("--headless", action="store_true", default=False)
     parser.addoption("--rerun", default=0, type=int)
     parser.addoption("--size", default=WINDOW_DEFAULT_SIZE)
+    parser.addoption("--tabs", default=1, type=int)
+    parser.addoption(
+        "--webdriver-record",
+        default=None,
+        help="Директория для записи команд веб-драйвера каждого теста",
+    )
+    parser.addoption(
+        "--webdriver-replay",
+        default=None,
+        help="Директория с записями для прогона тестов без браузера",
+    )
+    parser.addini(
+        "browser_profile",
+        help="Профиль запуска браузера: default или lean",
+        default="default",
+    )
+    parser.addini("test_data_seed", help="Сид генерации тестовых данных", default="1337")
+    parser.addini(
+        "test_data_pool_size",
+        help="Количество строк в пулах тестовых данных",
+        default="1000",
+    )
 
 
 def pytest_configure(config: Config):
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import os
+import threading
+
+import pytest
+
+from src.helpers.artifacts import ArtifactWriter, ArtifactWriteWarning
+
+
+@pytest.fixture
+def writer(tmp_path):
+    writer = ArtifactWriter(directory=str(tmp_path / "artifacts"), worker="gw1")
+    yield writer
+    writer.shutdown()
+
+
+def read_index(writer: ArtifactWriter) -> dict:
+    with open(os.path.join(writer.directory, "index_gw1.json"), encoding="utf-8") as file:
+        return json.load(file)
+
+
+def test_identical_artifacts_are_written_once(writer: ArtifactWriter):
+    raw = {"screenshot.png": b"png", "page_source.html": b"<html></html>"}
+
+    first = writer.submit("test_a", raw)
+    second = writer.submit("test_b", dict(raw))
+    writer.flush()
+
+    assert first == second
+    assert sorted(os.listdir(writer.directory)) == sorted(
+        [os.path.basename(path) for path in first.values()] + ["index_gw1.json"]
+    )
+    index = read_index(writer)
+    assert sorted(index["test_a"]) == sorted(index["test_b"])
+    assert len(index["test_a"]) == 2
+
+
+def test_only_uncompressed_formats_skip_gzip(writer: ArtifactWriter):
+    paths = writer.submit("test_a", {"screenshot.png": b"png", "log.json": b"[]"})
+    writer.flush()
+
+    assert paths["log.json"].endswith(".json.gz")
+    with gzip.open(paths["log.json"]) as file:
+        assert file.read() == b"[]"
+    with open(paths["screenshot.png"], "rb") as file:
+        assert file.read() == b"png"
+
+
+def test_flush_waits_for_pending_writes(writer: ArtifactWriter, monkeypatch):
+    release = threading.Event()
+    write = writer._write
+
+    def slow_write(*args):
+        release.wait(timeout=5)
+        return write(*args)
+
+    monkeypatch.setattr(writer, "_write", slow_write)
+    paths = writer.submit("test_a", {"page_source.html": b"<html></html>"})
+    assert not os.path.exists(paths["page_source.html"])
+
+    threading.Timer(0.05, release.set).start()
+    writer.flush()
+
+    assert os.path.exists(paths["page_source.html"])
+    assert list(read_index(writer)) == ["test_a"]
+
+
+def test_flush_merges_index_of_previous_flushes(writer: ArtifactWriter):
+    writer.submit("test_a", {"a.html": b"a"})
+    writer.flush()
+    writer.submit("test_b", {"b.html": b"b"})
+    writer.flush()
+
+    assert sorted(read_index(writer)) == ["test_a", "test_b"]
+
+
+def test_flush_surfaces_write_errors(tmp_path):
+    # На месте директории артефактов лежит файл, запись в неё невозможна
+    (blocked := tmp_path / "artifacts").write_bytes(b"")
+    writer = ArtifactWriter(directory=str(blocked))
+
+    writer.submit("test_a", {"a.html": b"a"})
+    with pytest.warns(ArtifactWriteWarning, match="1 failure artifact"):
+        writer.shutdown()
+    assert blocked.read_bytes() == b""
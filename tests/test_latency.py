@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from src.helpers.latency import (
+    DEFAULT_POLL_FREQUENCY,
+    MIN_POLL_FREQUENCY,
+    MIN_SAMPLES,
+    MIN_TIMEOUT,
+    LatencyModel,
+    percentile,
+)
+
+LOCATOR = "//table"
+
+
+@pytest.mark.parametrize(
+    ("samples", "share", "expected"),
+    [
+        ([3.0], 0.99, 3.0),
+        ([5.0, 1.0, 3.0, 2.0, 4.0], 0.5, 3.0),
+        ([5.0, 1.0, 3.0, 2.0, 4.0], 0.99, 5.0),
+        (list(map(float, range(1, 101))), 0.99, 99.0),
+        ([2.0, 1.0], 0.0, 1.0),
+    ],
+)
+def test_percentile_nearest_rank(samples, share, expected):
+    assert percentile(samples, share) == expected
+
+
+def test_defaults_until_enough_history():
+    model = LatencyModel()
+    for _ in range(MIN_SAMPLES - 1):
+        model.record(LOCATOR, 0.1)
+
+    assert model.timeout(LOCATOR, 10) == 10
+    assert model.poll_frequency(LOCATOR) == DEFAULT_POLL_FREQUENCY
+
+
+@pytest.mark.parametrize(
+    ("samples", "default", "expected"),
+    [
+        # p99 * 2 ниже нижней границы
+        ([0.1] * MIN_SAMPLES, 10, MIN_TIMEOUT),
+        # p99 * 2 в пределах границ
+        ([0.5, 0.5, 0.5, 0.5, 3.0], 10, 6.0),
+        # таймаут по умолчанию - верхняя граница
+        ([0.5, 0.5, 0.5, 0.5, 8.0], 10, 10),
+    ],
+)
+def test_timeout_is_clamped(samples, default, expected):
+    model = LatencyModel()
+    for seconds in samples:
+        model.record(LOCATOR, seconds)
+
+    assert model.timeout(LOCATOR, default) == expected
+
+
+def test_timed_out_wait_raises_learned_timeout():
+    model = LatencyModel()
+    for _ in range(MIN_SAMPLES):
+        model.record(LOCATOR, 0.1)
+    assert model.timeout(LOCATOR, 5) == MIN_TIMEOUT
+
+    # Истёкшее ожидание записывается как замер, равный таймауту
+    model.record(LOCATOR, MIN_TIMEOUT)
+    assert model.timeout(LOCATOR, 5) == MIN_TIMEOUT * 2
+
+
+@pytest.mark.parametrize(
+    ("median", "expected"),
+    [(0.1, MIN_POLL_FREQUENCY), (1.2, 0.3), (10.0, DEFAULT_POLL_FREQUENCY)],
+)
+def test_poll_frequency_is_clamped(median, expected):
+    model = LatencyModel()
+    for _ in range(MIN_SAMPLES):
+        model.record(LOCATOR, median)
+
+    assert model.poll_frequency(LOCATOR) == pytest.approx(expected)
+
+
+def test_recording_disabled_ignores_samples():
+    model = LatencyModel()
+    model.recording = False
+    for _ in range(MIN_SAMPLES):
+        model.record(LOCATOR, 0.1)
+
+    assert model.timeout(LOCATOR, 10) == 10
+    assert model.merge_into({}) == {}
+
+
+def test_merge_into_appends_new_samples_only_once():
+    model = LatencyModel(history_size=3)
+    model.load({LOCATOR: [9.0]})
+    model.record(LOCATOR, 1.0)
+    model.record(LOCATOR, 2.0)
+    model.record("//other", 0.5)
+
+    merged = model.merge_into({LOCATOR: [7.0, 8.0], "//stale": [1.0]})
+
+    assert merged == {LOCATOR: [8.0, 1.0, 2.0], "//other": [0.5], "//stale": [1.0]}
+    # Уже сохранённые замеры не дописываются повторно
+    assert model.merge_into(merged) == merged
+
+
+def test_load_extends_history():
+    model = LatencyModel()
+    model.load({LOCATOR: [0.5] * (MIN_SAMPLES - 1) + [3.0]})
+
+    assert model.timeout(LOCATOR, 10) == 6.0
+    assert model.merge_into({}) == {}
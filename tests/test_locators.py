@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import warnings
+from typing import Optional
+
+import pytest
+
+from src.helpers.locators import (
+    CSSLocator,
+    LocatorWarning,
+    warn_unanchored_scan,
+    xpath_to_css,
+)
+
+
+@pytest.mark.parametrize(
+    ("xpath", "selector", "first_only"),
+    [
+        ('//*[@id="resultSQL"]', "#resultSQL", False),
+        ('//*[@id="1abc"]', '[id="1abc"]', False),
+        ("//table[ancestor::*[@id='resultSQL']]", "#resultSQL table", False),
+        ('(//*[contains(@class, "CodeMirror")])[1]', '[class*="CodeMirror"]', True),
+        ('//input[starts-with(@name, "q")]', 'input[name^="q"]', False),
+        ('//a[@data-x="1"]', 'a[data-x="1"]', False),
+        ('//a[@title=""]', 'a[title=""]', False),
+        ("//div//a[@href]", "div a[href]", False),
+        ("//div/span", "div > span", False),
+        ('(//div[contains(@class, "CodeMirror")])[1]', 'div[class*="CodeMirror"]', True),
+        (".//th", "th", False),
+        (".//table[ancestor::*[@id='resultSQL']]", "#resultSQL table", False),
+        (".//div/span", ":scope div > span", False),
+        (".//div//a[@href]", ":scope div a[href]", False),
+        ("(.//tr/td)[1]", ":scope tr > td", True),
+    ],
+)
+def test_xpath_to_css_rewrites(xpath: str, selector: str, first_only: bool):
+    css: Optional[CSSLocator] = xpath_to_css(xpath)
+    assert css is not None, f"{xpath=} не переписан в css"
+    assert (css.selector, css.first_only) == (selector, first_only), f"{css=}"
+
+
+@pytest.mark.parametrize(
+    "xpath",
+    [
+        '//button[contains(text(), "Run SQL")]',
+        '//a[contains(@href, "")]',
+        '//a[starts-with(@href, "")]',
+        """//a[@title='say "hi"']""",
+        "//div//a[ancestor::main]",
+        ".//a[ancestor::main]/b",
+        "//td/following-sibling::td",
+        "//div[@a or @b]",
+        "//td/text()",
+        "//tr[2]",
+        "(//div)[2]",
+        '//div[@id="x"',
+        "/html/body",
+        "td",
+    ],
+)
+def test_xpath_to_css_rejects(xpath: str):
+    assert (css := xpath_to_css(xpath)) is None, f"{xpath=} переписан в {css=}"
+
+
+def test_css_locator_repr():
+    assert repr(CSSLocator("td", first_only=True)) == "CSSLocator('td', first_only=True)"
+
+
+@pytest.mark.parametrize(
+    ("xpath", "warned"),
+    [
+        ('//*[contains(@class, "warned-scan")]', True),
+        ('(//*[contains(@class, "warned-first-scan")])[1]', True),
+        ('//*[@id="not-warned-id"]', False),
+        ("(//*[ @id = 'not-warned-first-id'])[1]", False),
+        ('//div[contains(@class, "not-warned-tag")]', False),
+        ('.//*[@class="not-warned-relative"]', False),
+    ],
+)
+def test_warn_unanchored_scan(xpath: str, warned: bool):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        warn_unanchored_scan(xpath)
+        # Предупреждение о каждом локаторе выводится один раз
+        warn_unanchored_scan(xpath)
+
+    assert [warning.category for warning in caught] == [LocatorWarning] * warned
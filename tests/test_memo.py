@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import json
+from collections import Counter
+from typing import Any, Dict
+
+import pytest
+from selenium.webdriver.remote.command import Command
+
+from src.helpers.memo import MemoizingExecutor
+
+NO_EXPIRY = 60
+
+
+class CountingExecutor:
+    """Исполнитель, отвечающий номером вызова команды: `getCurrentUrl-1`, `getCurrentUrl-2`, ..."""
+
+    def __init__(self):
+        self.calls: Counter = Counter()
+        self.failing = set()
+
+    def execute(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls[command] += 1
+        if command in self.failing:
+            # Ошибка в том виде, как её отдаёт RemoteConnection
+            return {"status": 404, "value": json.dumps(
+                {"value": {"error": "no such window", "message": "", "stacktrace": ""}}
+            )}
+        return {"value": f"{command}-{self.calls[command]}"}
+
+
+@pytest.fixture
+def executor() -> CountingExecutor:
+    return CountingExecutor()
+
+
+@pytest.fixture
+def memo(executor: CountingExecutor) -> MemoizingExecutor:
+    return MemoizingExecutor(executor, ttl=NO_EXPIRY)
+
+
+def value(memo: MemoizingExecutor, command: str = Command.GET_CURRENT_URL) -> Any:
+    return memo.execute(command, {"sessionId": "1"})["value"]
+
+
+def test_repeated_reads_are_served_from_cache(memo, executor):
+    assert [value(memo) for _ in range(3)] == ["getCurrentUrl-1"] * 3
+    assert value(memo, Command.GET_TITLE) == "getTitle-1"
+
+    assert executor.calls == {Command.GET_CURRENT_URL: 1, Command.GET_TITLE: 1}
+    assert memo.stats() == {
+        "memo_hits": 2,
+        "memo_misses": 2,
+        f"memo_hits.{Command.GET_CURRENT_URL}": 2,
+    }
+
+
+def test_cached_response_is_a_copy(memo):
+    memo.execute(Command.GET_TITLE, {})["value"] = "changed by driver"
+
+    assert value(memo, Command.GET_TITLE) == "getTitle-1"
+
+
+def test_cached_response_expires_after_ttl(executor):
+    memo = MemoizingExecutor(executor, ttl=0)
+
+    assert [value(memo) for _ in range(2)] == ["getCurrentUrl-1", "getCurrentUrl-2"]
+    assert memo.stats()["memo_hits"] == 0
+
+
+@pytest.mark.parametrize(
+    "command", [Command.GET, Command.CLICK_ELEMENT, Command.W3C_EXECUTE_SCRIPT]
+)
+def test_mutating_and_script_commands_invalidate_cache(memo, command):
+    assert value(memo) == "getCurrentUrl-1"
+    memo.execute(command, {})
+
+    assert value(memo) == "getCurrentUrl-2"
+
+
+@pytest.mark.parametrize(
+    "command", [Command.FIND_ELEMENT, Command.GET_ELEMENT_TEXT, Command.SCREENSHOT]
+)
+def test_read_only_commands_keep_cache(memo, command):
+    assert value(memo) == "getCurrentUrl-1"
+    memo.execute(command, {})
+
+    assert value(memo) == "getCurrentUrl-1"
+
+
+def test_invalidate_clears_cache(memo):
+    assert value(memo) == "getCurrentUrl-1"
+    memo.invalidate()
+
+    assert value(memo) == "getCurrentUrl-2"
+
+
+def test_errors_are_not_cached(memo, executor):
+    executor.failing.add(Command.W3C_GET_CURRENT_WINDOW_HANDLE)
+    memo.execute(Command.W3C_GET_CURRENT_WINDOW_HANDLE, {})
+    executor.failing.clear()
+
+    assert value(memo, Command.W3C_GET_CURRENT_WINDOW_HANDLE) == "w3cGetCurrentWindowHandle-2"
+
+
+def test_reset_stats_starts_next_test_from_zero(memo):
+    value(memo)
+    value(memo)
+    memo.reset_stats()
+
+    assert memo.stats() == {"memo_hits": 0, "memo_misses": 0}
+    # Сброс статистики не сбрасывает сам кэш
+    assert value(memo) == "getCurrentUrl-1"
+    assert memo.stats()["memo_hits"] == 1
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import os
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from selenium.webdriver.remote.command import Command
+
+from src.helpers.composite_elements import TABLE_CHUNK_SCRIPT
+from src.helpers.latency import LATENCY_MODEL
+from src.helpers.replay import (
+    RecordingExecutor,
+    ReplayDriver,
+    ReplayExecutor,
+    ReplayMismatch,
+    command_key,
+)
+from src.helpers.singletons import SingletonDriver
+from src.page_objects.sql_page import SQLPage
+
+RECORDINGS_DIR = os.path.join(os.path.dirname(__file__), "recordings")
+PAGE_URL = "https://www.w3schools.com/sql/trysql.asp?filename=trysql_select_all"
+LONDON_QUERY = "select * from Customers where city = 'London'"
+
+
+class ScriptedExecutor:
+    """Исполнитель, отвечающий на команды заранее заданными ответами по порядку"""
+
+    def __init__(self, responses: List[Dict[str, Any]]):
+        self._responses = iter(responses)
+
+    def execute(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return next(self._responses)
+
+
+def write_recording(path: str, lines: List[Tuple[str, Dict[str, Any]]]) -> str:
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        file.writelines(json.dumps(line) + "\n" for line in lines)
+    return path
+
+
+def test_command_key_ignores_session_id():
+    assert command_key(Command.GET, {"url": "a", "sessionId": "1"}) == command_key(
+        Command.GET, {"url": "a", "sessionId": "2"}
+    )
+    assert command_key(Command.GET, {"url": "a"}) != command_key(
+        Command.GET, {"url": "b"}
+    )
+    assert command_key(Command.NEW_SESSION, {"capabilities": {}}) == Command.NEW_SESSION
+
+
+def test_recording_executor_saves_responses_as_received(tmp_path):
+    element = {"element-6066-11e4-a52e-4f735466cecf": "f.1"}
+    executor = ScriptedExecutor([{"value": dict(element)}])
+    recorder = RecordingExecutor(executor)
+
+    response = recorder.execute(Command.FIND_ELEMENT, {"using": "xpath", "value": "//a"})
+    # Веб-драйвер подменяет ответ на WebElement, в записи должен остаться исходный
+    response["value"] = object()
+    recorder.save(path := str(tmp_path / "nested" / "record.jsonl.gz"))
+
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        lines = [json.loads(line) for line in file]
+    assert lines == [
+        [
+            command_key(Command.FIND_ELEMENT, {"using": "xpath", "value": "//a"}),
+            {"value": element},
+        ]
+    ]
+
+
+def test_replay_executor_answers_in_order_and_repeats_last(tmp_path):
+    key = command_key(Command.GET_CURRENT_URL, {})
+    executor = ReplayExecutor(write_recording(
+        str(tmp_path / "record.jsonl.gz"),
+        [(key, {"value": "a"}), (key, {"value": "b"})],
+    ))
+
+    answers = [
+        executor.execute(Command.GET_CURRENT_URL, {"sessionId": "1"})["value"]
+        for _ in range(3)
+    ]
+    assert answers == ["a", "b", "b"]
+
+
+def test_replay_executor_returns_fresh_response_objects(tmp_path):
+    key = command_key(Command.GET_TITLE, {})
+    executor = ReplayExecutor(write_recording(
+        str(tmp_path / "record.jsonl.gz"), [(key, {"value": "title"})]
+    ))
+
+    executor.execute(Command.GET_TITLE, {})["value"] = "changed"
+    assert executor.execute(Command.GET_TITLE, {})["value"] == "title"
+
+
+def test_replay_executor_mismatch(tmp_path):
+    executor = ReplayExecutor(write_recording(str(tmp_path / "record.jsonl.gz"), []))
+
+    assert executor.execute(Command.QUIT, {}) == {"value": None}
+    with pytest.raises(ReplayMismatch):
+        executor.execute(Command.GET, {"url": "https://example.com"})
+
+
+@pytest.fixture
+def replayed_sql_page(monkeypatch: MonkeyPatch):
+    """
+    Страница с SQL-редактором поверх записанного прогона без браузера.
+    Записаны переход на страницу, ввод запроса через `window.editor`
+    и чтение таблицы результатов по запросу `LONDON_QUERY`: дважды из одного
+    состояния, потоково порциями по 1, 2 и 7 строк, поиском первой строки
+    порциями по 2 и после перерисовки таблицы в обратном порядке строк
+    """
+    monkeypatch.setattr(LATENCY_MODEL, "recording", False)
+    driver = ReplayDriver(
+        recording=os.path.join(RECORDINGS_DIR, "sql_page_london.jsonl.gz")
+    )
+    driver.element_timeout = 1
+    SingletonDriver(driver)
+    yield SQLPage()
+    SingletonDriver.clear_instance()
+
+
+def test_replay_sql_page(replayed_sql_page: SQLPage):
+    replayed_sql_page.get(PAGE_URL)
+    assert replayed_sql_page.send_and_confirm_query(LONDON_QUERY, via_editor=True)
+    table = replayed_sql_page.result_table.get_table_as_matrix()
+
+    assert len(table) == 6, f"{table=}"
+    assert {row.City for row in table} == {"London"}, f"{table=}"
+    assert table[1].CustomerName == "B's Beverages", f"{table[1]=}"
+
+
+def test_replay_snapshot_reread_after_rerender(replayed_sql_page: SQLPage):
+    replayed_sql_page.get(PAGE_URL)
+    assert replayed_sql_page.send_and_confirm_query(LONDON_QUERY, via_editor=True)
+    table = replayed_sql_page.result_table.get_table_as_matrix()
+
+    # Элемент таблицы на месте - снимок отдаётся из кэша
+    assert replayed_sql_page.result_table.get_table_as_matrix() == table
+    # Таблица заменена без команды драйвера - устаревший снимок не отдаётся
+    rerendered = replayed_sql_page.result_table.get_table_as_matrix()
+    assert rerendered == table[::-1], f"{rerendered=}"
+
+
+@pytest.fixture
+def fetched_chunks(replayed_sql_page: SQLPage, monkeypatch: MonkeyPatch) -> List[Tuple[int, int]]:
+    """Порции таблицы вида (начало, размер), запрошенные у драйвера"""
+    chunks = []
+    driver = replayed_sql_page.driver
+    execute_script = driver.execute_script
+
+    def spy(script: str, *args):
+        if script == TABLE_CHUNK_SCRIPT:
+            chunks.append(tuple(args[1:]))
+        return execute_script(script, *args)
+
+    monkeypatch.setattr(driver, "execute_script", spy)
+    return chunks
+
+
+@pytest.mark.parametrize(
+    ("chunk_size", "chunks"),
+    [
+        # Заголовок приходит отдельной порцией
+        (1, [(start, 1) for start in range(8)]),
+        # Последняя неполная порция завершает чтение
+        (2, [(0, 2), (2, 2), (4, 2), (6, 2)]),
+        # Порция ровно по размеру таблицы: конец виден только по пустой порции
+        (7, [(0, 7), (7, 7)]),
+    ],
+)
+def test_replay_iter_rows_chunk_boundaries(
+        replayed_sql_page: SQLPage, fetched_chunks, chunk_size, chunks,
+):
+    replayed_sql_page.get(PAGE_URL)
+    assert replayed_sql_page.send_and_confirm_query(LONDON_QUERY, via_editor=True)
+
+    rows = list(replayed_sql_page.result_table.iter_rows(chunk_size))
+
+    assert rows[0]._fields == (
+        "CustomerID", "CustomerName", "ContactName", "Address", "City", "PostalCode", "Country",
+    )
+    assert [row.CustomerID for row in rows] == ["4", "11", "16", "19", "53", "72"]
+    assert rows[1].CustomerName == "B's Beverages", f"{rows[1]=}"
+    assert fetched_chunks == chunks
+
+
+def test_replay_first_row_where_stops_at_match(replayed_sql_page: SQLPage, fetched_chunks):
+    replayed_sql_page.get(PAGE_URL)
+    assert replayed_sql_page.send_and_confirm_query(LONDON_QUERY, via_editor=True)
+
+    line = replayed_sql_page.result_table.first_row_where(
+        chunk_size=2, ContactName="Victoria Ashworth"
+    )
+
+    assert line.CustomerName == "B's Beverages", f"{line=}"
+    assert fetched_chunks == [(0, 2), (2, 2)]
+    assert replayed_sql_page.result_table.first_row_where(
+        chunk_size=2, ContactName="Nobody"
+    ) is None
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_iter_rows_rejects_empty_chunks(replayed_sql_page: SQLPage, chunk_size: int):
+    # Ошибка при вызове, а не при первом `next`, и без запросов к драйверу
+    with pytest.raises(ValueError, match="chunk_size"):
+        replayed_sql_page.result_table.iter_rows(chunk_size)
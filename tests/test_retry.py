@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+import time
+from typing import Any, Dict, List
+
+import pytest
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from src.helpers.retry import RETRY_STATS, StepRetryStats, retry_step
+
+
+class ScriptedPage:
+    """
+    Страница, действия которой по очереди возвращают либо выбрасывают
+    заданные исходы. Каждая попытка меняет состояние страницы
+    """
+
+    def __init__(self, *outcomes: Any):
+        self.outcomes = list(outcomes)
+        self.state = "initial"
+        self.calls = 0
+        self.checkpoints: List[str] = []
+        self.restored: List[str] = []
+
+    def checkpoint(self) -> Dict[str, Any]:
+        self.checkpoints.append(self.state)
+        return {"state": self.state}
+
+    def restore(self, checkpoint: Dict[str, Any]) -> None:
+        self.restored.append(checkpoint["state"])
+        self.state = checkpoint["state"]
+
+    def _next_outcome(self) -> Any:
+        self.calls += 1
+        self.state = f"after attempt {self.calls}"
+        if isinstance(outcome := self.outcomes.pop(0), Exception):
+            raise outcome
+        return outcome
+
+    @retry_step(attempts=3, backoff=0.5)
+    def act(self) -> Any:
+        return self._next_outcome()
+
+    @retry_step(attempts=3, backoff=0.5, retry_on_falsy=True, restore=False)
+    def wait(self) -> Any:
+        return self._next_outcome()
+
+    @retry_step(attempts=2, backoff=0.5)
+    def outer(self) -> Any:
+        return self.act()
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> List[float]:
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_success_takes_checkpoint_and_does_not_retry(sleeps):
+    page = ScriptedPage("done")
+
+    assert page.act() == "done"
+    assert (page.calls, page.checkpoints, page.restored, sleeps) == (1, ["initial"], [], [])
+    assert RETRY_STATS.summary()["step_retries"] == 0
+
+
+def test_retries_restore_state_from_before_first_attempt(sleeps):
+    page = ScriptedPage(TimeoutException(), StaleElementReferenceException(), "done")
+
+    assert page.act() == "done"
+    assert page.calls == 3
+    assert page.checkpoints == ["initial"]
+    assert page.restored == ["initial", "initial"]
+    assert sleeps == [0.5, 1.0]
+    assert RETRY_STATS.summary()["step_retries"] == 2
+
+
+def test_last_error_is_raised_when_attempts_are_exhausted(sleeps):
+    page = ScriptedPage(TimeoutException("1"), TimeoutException("2"), TimeoutException("3"))
+
+    with pytest.raises(TimeoutException, match="3"):
+        page.act()
+    assert page.calls == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_unexpected_errors_are_not_retried(sleeps):
+    page = ScriptedPage(ValueError("bug"), "done")
+
+    with pytest.raises(ValueError):
+        page.act()
+    assert (page.calls, sleeps) == (1, [])
+
+
+def test_falsy_results_are_retried_without_restore(sleeps):
+    page = ScriptedPage(None, "", "found")
+
+    assert page.wait() == "found"
+    assert (page.checkpoints, page.restored, sleeps) == ([], [], [0.5, 1.0])
+
+    assert ScriptedPage(None, False, "").wait() == ""
+
+
+def test_nested_steps_are_retried_only_by_outer_step(sleeps):
+    page = ScriptedPage(TimeoutException(), TimeoutException(), "done")
+
+    with pytest.raises(TimeoutException):
+        page.outer()
+    # Вложенное `act` не повторяется само: 2 попытки внешнего шага, а не 2 * 3
+    assert page.calls == 2
+    assert page.checkpoints == ["initial"]
+    assert sleeps == [0.5]
+
+    # После выхода из внешнего шага вложенный снова повторяется сам
+    assert page.act() == "done"
+
+
+def test_retry_stats_count_time_from_test_start(monkeypatch):
+    stats = StepRetryStats()
+    monkeypatch.setattr(stats, "test_started", 100.0)
+
+    stats.record(failed_at=110.0, retry_seconds=2.0)
+    stats.record(failed_at=120.0, retry_seconds=1.0)
+
+    assert stats.summary() == {
+        "step_retries": 2,
+        "step_retry_seconds": 3.0,
+        "step_retry_saved_seconds": 27.0,
+    }
+    stats.reset()
+    assert stats.summary()["step_retries"] == 0
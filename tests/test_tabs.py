@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import threading
+from typing import Any, Dict
+
+import pytest
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.helpers.tabs import TabScenarioError, TabScheduler
+
+
+class TabsChromedriver:
+    """Исполнитель, имитирующий вкладки chromedriver"""
+
+    def __init__(self):
+        self.active = "main"
+        self.windows = ["main"]
+        self._lock = threading.Lock()
+
+    def execute(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            if command == Command.NEW_SESSION:
+                return {"value": {"sessionId": "tabs", "capabilities": {}}}
+            if command == Command.W3C_GET_CURRENT_WINDOW_HANDLE:
+                return {"value": self.active}
+            if command == Command.NEW_WINDOW:
+                self.windows.append(handle := f"tab{len(self.windows)}")
+                return {"value": {"handle": handle, "type": "tab"}}
+            if command == Command.SWITCH_TO_WINDOW:
+                self.active = params["handle"]
+                return {"value": None}
+            if command == Command.GET_TITLE:
+                return {"value": self.active}
+            if command == Command.CLOSE:
+                self.windows.remove(self.active)
+                return {"value": None}
+        return {"value": None}
+
+
+@pytest.fixture
+def chromedriver() -> TabsChromedriver:
+    return TabsChromedriver()
+
+
+@pytest.fixture
+def scheduler(chromedriver: TabsChromedriver):
+    driver = WebDriver(command_executor=chromedriver, options=ChromeOptions())
+    scheduler = TabScheduler(driver=driver, tabs=2, page_factory=lambda: driver)
+    yield scheduler
+    scheduler.close()
+
+
+def read_title(driver: WebDriver) -> str:
+    return driver.title
+
+
+def test_run_switches_back_to_main_tab(
+        scheduler: TabScheduler, chromedriver: TabsChromedriver,
+):
+    results = scheduler.run([read_title] * 4)
+
+    assert set(results) <= {"main", "tab1"}
+    assert chromedriver.active == "main"
+
+    scheduler.close()
+    assert chromedriver.windows == ["main"]
+
+
+def test_failed_scenarios_keep_tracebacks(
+        scheduler: TabScheduler, chromedriver: TabsChromedriver,
+):
+    def broken_scenario(driver: WebDriver):
+        driver.title
+        raise ValueError("broken")
+
+    with pytest.raises(TabScenarioError) as error:
+        scheduler.run([read_title, broken_scenario])
+
+    assert [index for index, _ in error.value.failures] == [1]
+    assert "scenario #1:" in str(error.value)
+    assert "in broken_scenario" in str(error.value)
+    assert "ValueError: broken" in str(error.value)
+    assert chromedriver.active == "main"
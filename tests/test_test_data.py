@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from src.helpers.test_data import DataPool, sql_assignments, sql_literal, sql_values
+
+COLUMNS = {"CustomerName": "name", "City": "city"}
+
+
+@pytest.mark.parametrize(
+    ("value", "literal"),
+    [
+        ("London", "'London'"),
+        ("O'Reilly", "'O''Reilly'"),
+        ("''", "''''''"),
+        (42, "'42'"),
+        ("", "''"),
+    ],
+)
+def test_sql_literal_escapes_quotes(value, literal):
+    assert sql_literal(value) == literal
+
+
+def test_sql_values_and_assignments():
+    row = {"CustomerName": "B's Beverages", "City": "London"}
+
+    assert sql_values(row) == "(CustomerName, City) values ('B''s Beverages', 'London')"
+    assert sql_assignments(row) == "CustomerName = 'B''s Beverages', City = 'London'"
+
+
+def test_pool_is_reproducible_for_seed():
+    first = DataPool(COLUMNS, size=5, seed=1).load()
+    second = DataPool(COLUMNS, size=5, seed=1).load()
+    other = DataPool(COLUMNS, size=5, seed=2).load()
+
+    rows = [first.row() for _ in range(5)]
+    assert rows == [second.row() for _ in range(5)]
+    assert rows != [other.row() for _ in range(5)]
+    assert all(set(row) == set(COLUMNS) for row in rows)
+
+
+def test_pool_is_cached_on_disk(tmp_path, monkeypatch):
+    generated = DataPool(COLUMNS, size=3, seed=1, cache_dir=str(tmp_path)).load()
+    with open(generated.cache_path, encoding="utf-8") as file:
+        assert set(json.load(file)) == set(COLUMNS)
+
+    def generate(self):
+        raise AssertionError("pool must be read from the disk cache")
+
+    monkeypatch.setattr(DataPool, "_generate", generate)
+    cached = DataPool(COLUMNS, size=3, seed=1, cache_dir=str(tmp_path)).load()
+    assert [cached.row() for _ in range(3)] == [generated.row() for _ in range(3)]
+
+
+def test_cache_key_depends_on_pool_parameters(tmp_path):
+    path = DataPool(COLUMNS, size=3, seed=1, cache_dir=str(tmp_path)).cache_path
+
+    assert path == DataPool(dict(COLUMNS), size=3, seed=1, cache_dir=str(tmp_path)).cache_path
+    assert path != DataPool(COLUMNS, size=4, seed=1, cache_dir=str(tmp_path)).cache_path
+    assert path != DataPool(COLUMNS, size=3, seed=2, cache_dir=str(tmp_path)).cache_path
+    assert DataPool(COLUMNS).cache_path is None
+
+
+def test_workers_take_disjoint_rows_until_exhausted(tmp_path):
+    pools = [
+        DataPool(COLUMNS, size=7, seed=1, cache_dir=str(tmp_path),
+                 worker_index=index, workers_count=3).load()
+        for index in range(3)
+    ]
+    full = DataPool(COLUMNS, size=7, seed=1, cache_dir=str(tmp_path)).load()
+    expected = [full.row() for _ in range(7)]
+
+    # Воркер gwN берёт строки N, N + 3, N + 6, ...
+    taken = {index: [] for index in range(3)}
+    for index, pool in enumerate(pools):
+        with pytest.raises(UserWarning, match="exhausted"):
+            while True:
+                taken[index].append(pool.row())
+
+    assert taken == {
+        0: [expected[0], expected[3], expected[6]],
+        1: [expected[1], expected[4]],
+        2: [expected[2], expected[5]],
+    }
@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 from random import choice
+from typing import Dict
 
 import allure
-from faker import Faker
 
+from src.helpers.tabs import TabScheduler
+from src.helpers.test_data import sql_assignments, sql_values
 from src.page_objects.sql_page import SQLPage
 
 QUERY_EXEC_FAILED = "Запрос (%s) не выполнен или выполнен неудачно"
 EMPTY_TABLE = "Таблица пустая"
-fake = Faker()
 PAGE_URL = "https://www.w3schools.com/sql/trysql.asp?filename=trysql_select_all"
 
 
@@ -75,21 +76,12 @@ def test_2(sql_page: SQLPage):
 @allure.description(
     "Добавить новую запись в таблицу Customers и проверить, что эта запись добавилась"
 )
-def test_3(sql_page: SQLPage):
+def test_3(sql_page: SQLPage, customer_row: Dict[str, str]):
     assert_query = "select * from Customers order by 1 desc limit 1"
 
     sql_page.get(PAGE_URL)
-    fields = "CustomerName, ContactName, Address, City, PostalCode, Country"
-    values_list = [
-        fake.name(),
-        fake.name(),
-        fake.street_address(),
-        fake.city(),
-        fake.postcode(),
-        fake.country(),
-    ]
-    values_str = ", ".join(f'"{_}"' for _ in values_list)
-    insert_query = f"insert into Customers ({fields}) values ({values_str})"
+    values_list = list(customer_row.values())
+    insert_query = f"insert into Customers {sql_values(customer_row)}"
 
     with allure.step("Добавить новую запись в таблицу Customers"):
         assert sql_page.send_and_confirm_query(insert_query), (
@@ -110,7 +102,7 @@ def test_3(sql_page: SQLPage):
     "Обновить все поля (кроме CustomerID) в любой записи таблицы Customers и проверить, "
     "что изменения записались в базу"
 )
-def test_4(sql_page: SQLPage):
+def test_4(sql_page: SQLPage, customer_row: Dict[str, str]):
     full_query = "select CustomerID from Customers"
     sql_page.get(PAGE_URL)
 
@@ -132,13 +124,7 @@ def test_4(sql_page: SQLPage):
     selected_row = new_table[0]
 
     update_query = (
-        "update Customers set "
-        f"CustomerName = '{fake.name()}', "
-        f"ContactName = '{fake.name()}', "
-        f"Address = '{fake.street_address()}', "
-        f"City = '{fake.city()}', "
-        f"PostalCode = '{fake.postcode()}', "
-        f"Country = '{fake.country()}' "
+        f"update Customers set {sql_assignments(customer_row)} "
         f"where CustomerID = '{selected_customer_id}';"
     )
 
@@ -157,9 +143,29 @@ def test_4(sql_page: SQLPage):
         updated_row = updated_table[0]
         assert updated_row != selected_row, f"{updated_row=} == {selected_row=}"
 
-# @allure.description(
-#     "Придумать собственный автотест и реализовать "
-#     "(тут все ограничивается только вашей фантазией)"
-# )
-# def test_5(sql_page: SQLPage):
-#     pass
+
+@allure.description(
+    "Вывести покупателей нескольких городов независимыми сценариями во вкладках "
+    "одного браузера (их количество задаёт опция `--tabs`) и проверить, что в каждой "
+    "выборке только покупатели этого города"
+)
+def test_5(tab_scheduler: TabScheduler):
+    cities = ("London", "Berlin", "Madrid")
+
+    def customers_of(city: str):
+        def scenario(page: SQLPage):
+            query = f"select * from Customers where city = '{city}'"
+            page.get(PAGE_URL)
+            assert page.send_and_confirm_query(query), QUERY_EXEC_FAILED % query
+            return page.result_table.get_table_as_matrix()
+
+        return scenario
+
+    tables = tab_scheduler.run([customers_of(city) for city in cities])
+
+    for city, table in zip(cities, tables):
+        with allure.step(f"Проверить, что выведены только покупатели из {city}"):
+            assert table, EMPTY_TABLE
+            assert not (
+                strangers := [row.City for row in table if row.City != city]
+            ), f"{strangers=}"
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import os
+from collections import namedtuple
+
+import psutil
+import pytest
+
+from src.fixtures.workers import (
+    DEFAULT_BROWSER_FOOTPRINT_MB,
+    available_cpus,
+    available_memory_mb,
+    browser_footprint,
+    choose_workers_count,
+)
+from src.helpers.browser import BYTES_IN_MB
+
+HOST_MEMORY_MB = 64 * 1024
+HOST_CPUS = 8
+
+
+@pytest.mark.parametrize(
+    ("cpus", "memory_mb", "peak_rss_mb", "cpu_percent", "workers", "limited_by"),
+    [
+        # Маленькая машина: обоих ресурсов ровно на 2 браузера
+        (2, 2 * 1024, 500, 100, 2, "cpu"),
+        # Большая машина: память с запасом, упор в ядра
+        (32, 64 * 1024, 500, 100, 32, "cpu"),
+        # Много ядер, мало памяти: floor(8192 * 0.8 / 600) = 10
+        (32, 8 * 1024, 500, 100, 10, "memory"),
+        # Лёгкий браузер: не больше 2 воркеров на ядро
+        (4, 64 * 1024, 300, 10, 8, "cpu"),
+        # Загрузка ниже 25% считается как 25%: floor(4 * 100 / 25) = 16 > 8
+        (4, 64 * 1024, 300, 20, 8, "cpu"),
+        # Тяжёлый браузер: floor(8 * 100 / 200) = 4
+        (8, 64 * 1024, 500, 200, 4, "cpu"),
+        # Памяти не хватает даже на один браузер, но воркер всегда есть
+        (1, 512, 500, 100, 1, "memory"),
+    ],
+)
+def test_choose_workers_count(cpus, memory_mb, peak_rss_mb, cpu_percent, workers, limited_by):
+    decision = choose_workers_count(
+        cpus=cpus,
+        memory_mb=memory_mb,
+        footprint={"peak_rss_mb": peak_rss_mb, "cpu_percent": cpu_percent},
+    )
+
+    assert (decision["workers"], decision["limited_by"]) == (workers, limited_by), decision
+
+
+def test_browser_footprint_defaults_and_percentiles():
+    assert browser_footprint({}) == {
+        "peak_rss_mb": DEFAULT_BROWSER_FOOTPRINT_MB,
+        "cpu_percent": 100,
+    }
+    assert browser_footprint({
+        "peak_rss_mb": [float(value) for value in range(100, 1100, 100)],
+        "cpu_percent": [10.0, 50.0, 90.0],
+    }) == {"peak_rss_mb": 900.0, "cpu_percent": 50.0}
+
+
+@pytest.fixture
+def host(monkeypatch):
+    """Хост с `HOST_CPUS` ядрами и `HOST_MEMORY_MB` свободной памяти"""
+    memory = namedtuple("svmem", "available")(HOST_MEMORY_MB * BYTES_IN_MB)
+    monkeypatch.setattr(psutil, "virtual_memory", lambda: memory)
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(HOST_CPUS)), raising=False)
+
+
+def write_files(root, files):
+    for name, content in files.items():
+        (path := root / name).parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return str(root)
+
+
+@pytest.mark.parametrize(
+    ("files", "cpus", "memory_mb"),
+    [
+        # Без cgroup - ресурсы хоста
+        ({}, HOST_CPUS, HOST_MEMORY_MB),
+        # cgroup v2 без лимитов
+        ({"cpu.max": "max 100000", "memory.max": "max", "memory.current": "0"},
+         HOST_CPUS, HOST_MEMORY_MB),
+        # cgroup v2 с лимитами: 2.5 ядра, 4 ГБ, из них занят 1 ГБ
+        ({"cpu.max": "250000 100000", "memory.max": str(4 * 1024 * BYTES_IN_MB),
+          "memory.current": str(1024 * BYTES_IN_MB)},
+         2.5, 3 * 1024),
+        # cgroup v1 без лимитов: квота -1, лимит памяти порядка 2**63
+        ({"cpu/cpu.cfs_quota_us": "-1", "cpu/cpu.cfs_period_us": "100000",
+          "memory/memory.limit_in_bytes": "9223372036854771712",
+          "memory/memory.usage_in_bytes": str(1024 * BYTES_IN_MB)},
+         HOST_CPUS, HOST_MEMORY_MB),
+        # cgroup v1 с лимитами: 2 ядра, 2 ГБ, из них занято 512 МБ
+        ({"cpu/cpu.cfs_quota_us": "200000", "cpu/cpu.cfs_period_us": "100000",
+          "memory/memory.limit_in_bytes": str(2 * 1024 * BYTES_IN_MB),
+          "memory/memory.usage_in_bytes": str(512 * BYTES_IN_MB)},
+         2, 1536),
+        # Квота меньше ядра округляется до одного ядра
+        ({"cpu.max": "50000 100000"}, 1, HOST_MEMORY_MB),
+    ],
+)
+def test_available_resources_respect_cgroup_limits(host, tmp_path, files, cpus, memory_mb):
+    cgroup_root = write_files(tmp_path, files)
+
+    assert available_cpus(cgroup_root) == cpus
+    assert available_memory_mb(cgroup_root) == memory_mb